@@ -14,6 +14,8 @@
 #include <linux/fs.h>
 #include <linux/uaccess.h>
 #include <linux/string.h>
+#include <linux/workqueue.h>
+#include <linux/interrupt.h>
 
 #define ESC_600_INT_WANTED
 //#define PREVIOUS_CHECK_TYPE
@@ -28,6 +30,15 @@
 #define TURN_OFF            0
 #define TURN_ON             1
 
+#ifdef ESC_600_INT_WANTED
+/* interval of the presence/interrupt watch when the card has no IRQ line wired */
+#define QSFP_INT_POLL_INTERVAL_MS   100
+/* interval of the watch behind the IRQ, for the changes which don't raise it (e.g. presence) */
+#define QSFP_INT_FALLBACK_POLL_INTERVAL_MS  2000
+/* status of the watch when the CPLD registers can't be read, out of range of the 16 bits registers */
+#define QSFP_INT_STAT_UNREADABLE    0xffffffff
+#endif
+
 enum model_type{ 
     MODEL_TYPE_100G = 0,
     MODEL_TYPE_400G = 1,
@@ -45,11 +56,14 @@ static ssize_t phy_reset_set(struct device *dev, struct device_attribute *da, co
 static ssize_t QSFP_int_get(struct device *dev, struct device_attribute *da, char *buf);
 #endif
 static ssize_t QSFP_status_all_get(struct device *dev, struct device_attribute *da, char *buf);
+static ssize_t QSFP_present_bitmap_get(struct device *dev, struct device_attribute *da, char *buf);
 static ssize_t low_power_all_get(struct device *dev, struct device_attribute *da, char *buf);
 static ssize_t low_power_all_set(struct device *dev, struct device_attribute *da, const char *buf, size_t count);
 static ssize_t low_power_get(struct device *dev, struct device_attribute *da, char *buf);
 static ssize_t low_power_set(struct device *dev, struct device_attribute *da, const char *buf, size_t count);
 static ssize_t qsfp_reset_set(struct device *dev, struct device_attribute *da, const char *buf, size_t count);
+static ssize_t qsfp_bulk_get(struct device *dev, struct device_attribute *da, char *buf);
+static ssize_t qsfp_bulk_set(struct device *dev, struct device_attribute *da, const char *buf, size_t count);
 static ssize_t qsfp_status_get(struct device *dev, struct device_attribute *da, char *buf);
 
 /* struct i2c_data */
@@ -62,8 +76,21 @@ struct Cameo_i2c_data
 #ifdef PREVIOUS_CHECK_TYPE    
     u8                  model_type;
 #endif
+#ifdef ESC_600_INT_WANTED
+    struct i2c_client  *client;
+    struct mutex        int_lock;       /* serializes int_work and the IRQ thread */
+    struct delayed_work int_work;       /* watch of 0x80/0x81 and 0x90/0x91 */
+    u32                 last_present;
+    u32                 last_int;
+    char                irq_enabled;    /* !=0 if client->irq wakes up the waiters, int_work is the fallback */
+    char                int_armed;      /* !=0 from a read of QSFP_int until the next notification */
+#endif
 };
 
+#ifdef ESC_600_INT_WANTED
+static void qsfp_int_arm(struct Cameo_i2c_data *data);
+#endif
+
 /* struct i2c_sysfs_attributes */
 enum Cameo_i2c_sysfs_attributes
 {
@@ -73,7 +100,10 @@ enum Cameo_i2c_sysfs_attributes
     QSFP_LOW_POWER_ALL,
     QSFP_RESET,
     QSFP_PRESENT,
-    QSFP_INT
+    QSFP_PRESENT_BITMAP,
+    QSFP_INT,
+    QSFP_LOW_POWER_BULK,
+    QSFP_RESET_BULK
 };
 /* end of struct i2c_sysfs_attributes */
 
@@ -120,7 +150,10 @@ static SENSOR_DEVICE_ATTR(QSFP_low_power_16         , S_IRUGO | S_IWUSR , low_po
 
 static SENSOR_DEVICE_ATTR(QSFP_low_power_all        , S_IRUGO | S_IWUSR , low_power_all_get             , low_power_all_set         , QSFP_LOW_POWER_ALL);
 //static SENSOR_DEVICE_ATTR(QSFP_reset                , S_IRUGO | S_IWUSR , NULL                          , qsfp_reset_set            , QSFP_RESET);
+static SENSOR_DEVICE_ATTR(QSFP_low_power_bulk       , S_IRUGO | S_IWUSR , qsfp_bulk_get                 , qsfp_bulk_set             , QSFP_LOW_POWER_BULK);
+static SENSOR_DEVICE_ATTR(QSFP_reset_bulk           , S_IRUGO | S_IWUSR , qsfp_bulk_get                 , qsfp_bulk_set             , QSFP_RESET_BULK);
 static SENSOR_DEVICE_ATTR(QSFP_present_all          , S_IRUGO           , QSFP_status_all_get           , NULL                      , QSFP_PRESENT);
+static SENSOR_DEVICE_ATTR(QSFP_present_bitmap       , S_IRUGO           , QSFP_present_bitmap_get       , NULL                      , QSFP_PRESENT_BITMAP);
 static SENSOR_DEVICE_ATTR(QSFP_present_1            , S_IRUGO           , qsfp_status_get               , NULL                      , 1);
 static SENSOR_DEVICE_ATTR(QSFP_present_2            , S_IRUGO           , qsfp_status_get               , NULL                      , 2);
 static SENSOR_DEVICE_ATTR(QSFP_present_3            , S_IRUGO           , qsfp_status_get               , NULL                      , 3);
@@ -183,7 +216,10 @@ static struct attribute *phy_cpld640_QSFP_attributes[] =
     &sensor_dev_attr_QSFP_low_power_15.dev_attr.attr,
     &sensor_dev_attr_QSFP_low_power_16.dev_attr.attr,
 //    &sensor_dev_attr_QSFP_reset.dev_attr.attr,
+    &sensor_dev_attr_QSFP_low_power_bulk.dev_attr.attr,
+    &sensor_dev_attr_QSFP_reset_bulk.dev_attr.attr,
     &sensor_dev_attr_QSFP_present_all.dev_attr.attr,
+    &sensor_dev_attr_QSFP_present_bitmap.dev_attr.attr,
     &sensor_dev_attr_QSFP_present_1.dev_attr.attr,
     &sensor_dev_attr_QSFP_present_2.dev_attr.attr,
     &sensor_dev_attr_QSFP_present_3.dev_attr.attr,
@@ -495,6 +531,8 @@ static ssize_t QSFP_int_get(struct device *dev, struct device_attribute *da, cha
             qsfp_stat = qsfp_stat >> 1;
         }
 
+        /* userspace waits for the next change of QSFP_int after reading it */
+        qsfp_int_arm(data);
     }
 
     return sprintf(buf, "%s\n", buf);
@@ -856,6 +894,155 @@ static ssize_t qsfp_reset_set(struct device *dev, struct device_attribute *da, c
     return count;
 }
 
+/********************************************************************************/
+/*    Function Name      : qsfp_bulk_get                                        */
+/*    Description        : This is the function to get low power mode or reset  */
+/*                         of all QSFP as one bitmap, bit N set means port N+1  */
+/*                         is in low power mode / held in reset                 */
+/*                         0x32 0x60 0x61 / 0x32 0x70 0x71                      */
+/*    Input(s)           : None.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : String.                                              */
+/********************************************************************************/
+static ssize_t qsfp_bulk_get(struct device *dev, struct device_attribute *da, char *buf)
+{
+    int lo = 0;
+    int hi = 0;
+    u8 reg = 0x60;
+    u32 qsfp_stat = 0;
+    u32 port_mask = 0x0f;
+    u8 model_type = MODEL_TYPE_UNKNOWN;
+    struct i2c_client *client = to_i2c_client(dev);
+    struct Cameo_i2c_data *data = i2c_get_clientdata(client);
+    struct sensor_device_attribute *attr = to_sensor_dev_attr(da);
+
+    if (attr->index == QSFP_RESET_BULK)
+        reg = 0x70;
+    else if (attr->index != QSFP_LOW_POWER_BULK)
+        return -EINVAL;
+
+#ifdef PREVIOUS_CHECK_TYPE
+    model_type = data->model_type;
+#else
+    model_type = get_model_type(client, data);
+#endif
+
+    if (model_type == MODEL_TYPE_UNKNOWN)
+        return -ENODEV;
+    if (model_type == MODEL_TYPE_100G)
+        port_mask = 0xffff;
+
+    mutex_lock(&data->update_lock);
+    lo = i2c_smbus_read_byte_data(client, reg);
+    if (lo >= 0 && model_type == MODEL_TYPE_100G)
+    {
+        hi = i2c_smbus_read_byte_data(client, reg + 1);
+    }
+    mutex_unlock(&data->update_lock);
+
+    if (lo < 0)
+        return lo;
+    if (hi < 0)
+        return hi;
+
+    qsfp_stat = ((u32)hi << 8) | (u32)lo;
+    /* reset is active low, invert so that 1 means held in reset */
+    if (attr->index == QSFP_RESET_BULK)
+        qsfp_stat = ~qsfp_stat;
+
+    return sprintf(buf, "0x%04x\n", qsfp_stat & port_mask);
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_bulk_set                                        */
+/*    Description        : This is the function to set low power mode or reset  */
+/*                         of several QSFP with one write of each register      */
+/*                         input "mask value" in hex, bit N of mask selects     */
+/*                         port N+1, bit N of value 1 to enable low power mode  */
+/*                         / reset                                              */
+/*                         0x32 0x60 0x61 / 0x32 0x70 0x71                      */
+/*    Input(s)           : None.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : count, or errno if the input or a register access    */
+/*                         fails                                                */
+/********************************************************************************/
+static ssize_t qsfp_bulk_set(struct device *dev, struct device_attribute *da, const char *buf, size_t count)
+{
+    int ret = 0;
+    int i;
+    u8 reg = 0x60;
+    u8 reg_num = 1;
+    u8 mask_byte;
+    u8 value_byte;
+    u8 cur;
+    unsigned int mask = 0;
+    unsigned int value = 0;
+    u8 model_type = MODEL_TYPE_UNKNOWN;
+    struct i2c_client *client = to_i2c_client(dev);
+    struct Cameo_i2c_data *data = i2c_get_clientdata(client);
+    struct sensor_device_attribute *attr = to_sensor_dev_attr(da);
+
+    if (attr->index == QSFP_RESET_BULK)
+        reg = 0x70;
+    else if (attr->index != QSFP_LOW_POWER_BULK)
+        return -EINVAL;
+
+    if (sscanf(buf, "%x %x", &mask, &value) != 2)
+    {
+        printk(KERN_ALERT "qsfp_bulk_set wrong value\n");
+        return -EINVAL;
+    }
+
+#ifdef PREVIOUS_CHECK_TYPE
+    model_type = data->model_type;
+#else
+    model_type = get_model_type(client, data);
+#endif
+
+    if (model_type == MODEL_TYPE_UNKNOWN)
+    {
+        printk(KERN_ALERT "qsfp_bulk_set type ERR\n");
+        return -ENODEV;
+    }
+    if (model_type == MODEL_TYPE_100G)
+        reg_num = 2;
+    else
+        mask &= 0x0f;
+
+    /* reset is active low */
+    if (attr->index == QSFP_RESET_BULK)
+        value = ~value;
+
+    mutex_lock(&data->update_lock);
+    for (i = 0; i < reg_num; i++)
+    {
+        mask_byte = (mask >> (i * 8)) & 0xff;
+        value_byte = (value >> (i * 8)) & 0xff;
+        if (mask_byte == 0)
+            continue;
+
+        ret = i2c_smbus_read_byte_data(client, reg + i);
+        if (ret < 0)
+        {
+            printk(KERN_ALERT "qsfp_bulk_set read err(%d)\n", ret);
+            break;
+        }
+        cur = (u8)ret;
+        ret = i2c_smbus_write_byte_data(client, reg + i, (cur & ~mask_byte) | (value_byte & mask_byte));
+        if (ret < 0)
+        {
+            printk(KERN_ALERT "qsfp_bulk_set write err(%d)\n", ret);
+            break;
+        }
+        debug_print((KERN_DEBUG "DEBUG : qsfp_bulk_set reg %x = %x\n", reg + i, (cur & ~mask_byte) | (value_byte & mask_byte)));
+    }
+    mutex_unlock(&data->update_lock);
+
+    if (ret < 0)
+        return ret;
+    return count;
+}
+
 /********************************************************************************/
 /*    Function Name      : QSFP_status_all_get                                  */
 /*    Description        : This is the function to get all QSFP insert status   */
@@ -917,6 +1104,62 @@ static ssize_t QSFP_status_all_get(struct device *dev, struct device_attribute *
 
 }
 
+/********************************************************************************/
+/*    Function Name      : QSFP_present_bitmap_get                              */
+/*    Description        : This is the function to get all QSFP insert status   */
+/*                         as one bitmap, bit N set means port N+1 is present   */
+/*                         0x32 0x80 0x81                                       */
+/*    Input(s)           : None.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : String.                                              */
+/********************************************************************************/
+static ssize_t QSFP_present_bitmap_get(struct device *dev, struct device_attribute *da, char *buf)
+{
+    int lo = 0;
+    int hi = 0;
+    u32 qsfp_stat = 0;
+    u32 port_mask = 0x0f;
+    u8 model_type = MODEL_TYPE_UNKNOWN;
+    struct i2c_client *client = to_i2c_client(dev);
+    struct Cameo_i2c_data *data = i2c_get_clientdata(client);
+    struct sensor_device_attribute *attr = to_sensor_dev_attr(da);
+
+    if (attr->index != QSFP_PRESENT_BITMAP)
+        return -EINVAL;
+
+#ifdef PREVIOUS_CHECK_TYPE
+    model_type = data->model_type;
+#else
+    model_type = get_model_type(client, data);
+#endif
+
+    if (model_type == MODEL_TYPE_UNKNOWN)
+        return -ENODEV;
+
+    mutex_lock(&data->update_lock);
+    lo = i2c_smbus_read_byte_data(client, 0x80); //to get register 0x32 0x80
+    if (lo >= 0 && model_type == MODEL_TYPE_100G)
+    {
+        hi = i2c_smbus_read_byte_data(client, 0x81); //to get register 0x32 0x81
+    }
+    mutex_unlock(&data->update_lock);
+
+    if (lo < 0)
+        return lo;
+    if (hi < 0)
+        return hi;
+
+    if (model_type == MODEL_TYPE_100G)
+        port_mask = 0xffff;
+
+    /* CPLD reports 1 for an empty cage, invert so that 1 means present */
+    qsfp_stat = ~(((u32)hi << 8) | (u32)lo) & port_mask;
+
+    debug_print((KERN_DEBUG "DEBUG : QSFP_present_bitmap_get bitmap = %x\n", qsfp_stat));
+
+    return sprintf(buf, "0x%04x\n", qsfp_stat);
+}
+
 /********************************************************************************/
 /*    Function Name      : qsfp_status_get                                      */
 /*    Description        : This is the function to get QSFP insert status       */
@@ -975,6 +1218,196 @@ static ssize_t qsfp_status_get(struct device *dev, struct device_attribute *da,
     
 }
 
+#ifdef ESC_600_INT_WANTED
+/********************************************************************************/
+/*    Function Name      : qsfp_int_read_stat                                   */
+/*    Description        : This is the function to read QSFP insert and         */
+/*                         interrupt status, the high registers only on 100G    */
+/*                         cards, reading the interrupt status acks it          */
+/*                         0x32 0x80 0x81 0x90 0x91                             */
+/*    Input(s)           : client, data.                                        */
+/*    Output(s)          : present_stat, int_stat.                              */
+/*    Returns            : None.                                                */
+/********************************************************************************/
+static void qsfp_int_read_stat(struct i2c_client *client, struct Cameo_i2c_data *data,
+                               u32 *present_stat, u32 *int_stat)
+{
+    int present_lo, present_hi = 0, int_lo, int_hi = 0;
+    u8 model_type = MODEL_TYPE_UNKNOWN;
+
+#ifdef PREVIOUS_CHECK_TYPE
+    model_type = data->model_type;
+#else
+    model_type = get_model_type(client, data);
+#endif
+    if (model_type == MODEL_TYPE_UNKNOWN)
+    {
+        /* the line card is pulled out or its CPLD stops answering */
+        *present_stat = QSFP_INT_STAT_UNREADABLE;
+        *int_stat = QSFP_INT_STAT_UNREADABLE;
+        return;
+    }
+
+    mutex_lock(&data->update_lock);
+    present_lo = i2c_smbus_read_byte_data(client, 0x80); //to get register 0x32 0x80
+    int_lo = i2c_smbus_read_byte_data(client, 0x90); //to get register 0x32 0x90
+    if (model_type == MODEL_TYPE_100G)
+    {
+        present_hi = i2c_smbus_read_byte_data(client, 0x81); //to get register 0x32 0x81
+        int_hi = i2c_smbus_read_byte_data(client, 0x91); //to get register 0x32 0x91
+    }
+    mutex_unlock(&data->update_lock);
+
+    if (present_lo >= 0 && present_hi >= 0 && int_lo >= 0 && int_hi >= 0)
+    {
+        *present_stat = ((u32)present_hi << 8) | (u32)present_lo;
+        *int_stat = ((u32)int_hi << 8) | (u32)int_lo;
+    }
+    else
+    {
+        *present_stat = QSFP_INT_STAT_UNREADABLE;
+        *int_stat = QSFP_INT_STAT_UNREADABLE;
+    }
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_poll_interval                               */
+/*    Description        : This is the function to get the interval of int_work */
+/*    Input(s)           : data.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : jiffies.                                             */
+/********************************************************************************/
+static unsigned long qsfp_int_poll_interval(struct Cameo_i2c_data *data)
+{
+    if (data->irq_enabled)
+        return msecs_to_jiffies(QSFP_INT_FALLBACK_POLL_INTERVAL_MS);
+    return msecs_to_jiffies(QSFP_INT_POLL_INTERVAL_MS);
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_arm                                         */
+/*    Description        : This is the function to start the watch of QSFP_int  */
+/*                         after userspace read it, the watch stops on the next */
+/*                         notification so the bus is idle while nobody waits   */
+/*    Input(s)           : data.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : None.                                                */
+/********************************************************************************/
+static void qsfp_int_arm(struct Cameo_i2c_data *data)
+{
+    data->int_armed = 1;
+    /* no-op if the work is already pending */
+    schedule_delayed_work(&data->int_work, qsfp_int_poll_interval(data));
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_check                                       */
+/*    Description        : This is the function to wake up the poll() waiters   */
+/*                         of QSFP_int when insert or interrupt status changed  */
+/*    Input(s)           : data.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : None.                                                */
+/********************************************************************************/
+static void qsfp_int_check(struct Cameo_i2c_data *data)
+{
+    u32 present_stat, int_stat;
+    struct i2c_client *client = data->client;
+
+    mutex_lock(&data->int_lock);
+    qsfp_int_read_stat(client, data, &present_stat, &int_stat);
+    if (present_stat != data->last_present || int_stat != data->last_int)
+    {
+        debug_print((KERN_DEBUG "DEBUG : qsfp_int_check present = %x int = %x\n", present_stat, int_stat));
+        data->last_present = present_stat;
+        data->last_int = int_stat;
+        /* sysfs only notifies again after a read, which arms the watch again */
+        data->int_armed = 0;
+        sysfs_notify(&client->dev.kobj, NULL, "QSFP_int");
+    }
+    mutex_unlock(&data->int_lock);
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_work_handler                                */
+/*    Description        : This is the function to watch QSFP insert and        */
+/*                         interrupt status while QSFP_int is armed             */
+/*    Input(s)           : work.                                                */
+/*    Output(s)          : None.                                                */
+/*    Returns            : None.                                                */
+/********************************************************************************/
+static void qsfp_int_work_handler(struct work_struct *work)
+{
+    struct Cameo_i2c_data *data = container_of(to_delayed_work(work), struct Cameo_i2c_data, int_work);
+
+    if (!data->int_armed)
+        return;
+    qsfp_int_check(data);
+    if (data->int_armed)
+        schedule_delayed_work(&data->int_work, qsfp_int_poll_interval(data));
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_irq_handler                                 */
+/*    Description        : This is the threaded handler of the CPLD interrupt,  */
+/*                         it reads (acks) the latched 0x90/0x91 status so the  */
+/*                         line is released, and wakes up the poll() waiters    */
+/*    Input(s)           : irq, dev_id.                                         */
+/*    Output(s)          : None.                                                */
+/*    Returns            : IRQ_HANDLED.                                         */
+/********************************************************************************/
+static irqreturn_t qsfp_int_irq_handler(int irq, void *dev_id)
+{
+    struct Cameo_i2c_data *data = dev_id;
+
+    qsfp_int_check(data);
+    return IRQ_HANDLED;
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_notify_start                                */
+/*    Description        : This is the function to start QSFP_int notification, */
+/*                         by IRQ if the client has one, int_work polls while   */
+/*                         QSFP_int is armed, slowly behind the IRQ             */
+/*                         int_work is initialized before the sysfs group is    */
+/*                         created, a read of QSFP_int may arm it at any time   */
+/*    Input(s)           : client, data.                                        */
+/*    Output(s)          : None.                                                */
+/*    Returns            : None.                                                */
+/********************************************************************************/
+static void qsfp_int_notify_start(struct i2c_client *client, struct Cameo_i2c_data *data)
+{
+    data->irq_enabled = 0;
+    /* the status at probe time is the base of the first notification */
+    qsfp_int_read_stat(client, data, &data->last_present, &data->last_int);
+
+    if (client->irq > 0)
+    {
+        if (request_threaded_irq(client->irq, NULL, qsfp_int_irq_handler,
+                                 IRQF_TRIGGER_FALLING | IRQF_ONESHOT, client->name, data) == 0)
+        {
+            data->irq_enabled = 1;
+            return;
+        }
+        dev_info(&client->dev, "irq %d not available, fall back to polling\n", client->irq);
+    }
+}
+
+/********************************************************************************/
+/*    Function Name      : qsfp_int_notify_stop                                 */
+/*    Description        : This is the function to stop QSFP_int notification   */
+/*    Input(s)           : client, data.                                        */
+/*    Output(s)          : None.                                                */
+/*    Returns            : None.                                                */
+/********************************************************************************/
+static void qsfp_int_notify_stop(struct i2c_client *client, struct Cameo_i2c_data *data)
+{
+    if (data->irq_enabled)
+        free_irq(client->irq, data);
+    data->int_armed = 0;
+    cancel_delayed_work_sync(&data->int_work);
+}
+#endif
+
 /* end of function */
 /********************************************************************************/
 /*    Function Name      : Cameo_i2c_probe                                      */
@@ -1010,6 +1443,11 @@ static int phy_cpld640_probe(struct i2c_client *client, const struct i2c_device_
     i2c_set_clientdata(client, data);
 
     mutex_init(&data->update_lock);
+#ifdef ESC_600_INT_WANTED
+    data->client = client;
+    mutex_init(&data->int_lock);
+    INIT_DELAYED_WORK(&data->int_work, qsfp_int_work_handler);
+#endif
     data->valid = 0;
     dev_info(&client->dev, "chip found\n");
 
@@ -1055,10 +1493,17 @@ static int phy_cpld640_probe(struct i2c_client *client, const struct i2c_device_
     }
     dev_info(&client->dev, "%s: '%s'\n", dev_name(data->hwmon_dev), client->name);
 
+#ifdef ESC_600_INT_WANTED
+    qsfp_int_notify_start(client, data);
+#endif
+
     return 0;
 
 exit_remove:
     sysfs_remove_group(&client->dev.kobj, &phy_cpld640_QSFP_group);
+#ifdef ESC_600_INT_WANTED
+    cancel_delayed_work_sync(&data->int_work);
+#endif
 
 exit_free:
     kfree(data);
@@ -1071,6 +1516,10 @@ static int phy_cpld640_remove(struct i2c_client *client)
     struct Cameo_i2c_data *data = i2c_get_clientdata(client);
     hwmon_device_unregister(data->hwmon_dev);
     sysfs_remove_group(&client->dev.kobj, &phy_cpld640_QSFP_group);
+#ifdef ESC_600_INT_WANTED
+    /* after the sysfs group is gone, no read of QSFP_int can arm int_work again */
+    qsfp_int_notify_stop(client, data);
+#endif
     kfree(data);
     return 0;
 }
@@ -9,21 +9,53 @@
 
 try:
     import os
+    import re
     import time
+    import json
+    import select
+    import tempfile
     import subprocess
+    import threading
     from sonic_platform_base.chassis_base import ChassisBase
+    from sonic_py_common.logger import Logger
     from sonic_platform.platDev import PlatDev
     from sonic_platform.fan import Fan
     from sonic_platform.psu import Psu
     from sonic_platform.sfp import Sfp
+    from sonic_platform.dom_alarm import get_threshold_violations
+    from sonic_platform.dom_history import DomHistory, DOM_HISTORY_TIERS
+    from sonic_platform.hw_snapshot import HardwareSnapshot
+    from sonic_platform.sysfs_attr import get_attr_cache_stats
     from sonic_platform.thermal import Thermal
     from sonic_platform.eeprom import Eeprom
     from sonic_platform.component import Component
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
+logger = Logger("chassis")
+
 GET_HWSKU_CMD = "sonic-cfggen -d -v DEVICE_METADATA.localhost.hwsku"
 GET_PLATFORM_CMD = "sonic-cfggen -d -v DEVICE_METADATA.localhost.platform"
+# hwsku and platform are resolved in process, the sonic-cfggen commands above are the fallback
+#   platform: PLATFORM environment variable, onie_platform/aboot_platform of machine.conf
+#   both: DEVICE_METADATA|localhost of the running CONFIG_DB, or of config_db.json when
+#         CONFIG_DB can't be read (the saved file may differ from the running config),
+#         the values of config_db.json are cached until the file is modified
+MACHINE_CONF_FILE = "/host/machine.conf"
+MACHINE_CONF_PLATFORM_KEYS = ("onie_platform", "aboot_platform")
+CONFIG_DB_FILE = "/etc/sonic/config_db.json"
+DEVICE_METADATA_CACHE_FILE = "/var/cache/sonic/platform-metadata/device_metadata.json"
+
+# swsscommon (swsssdk on older images) is optional, it's imported when DEVICE_METADATA is read
+def _import_config_db_connector():
+    try:
+        from swsscommon.swsscommon import ConfigDBConnector
+    except ImportError:
+        try:
+            from swsssdk import ConfigDBConnector
+        except ImportError:
+            ConfigDBConnector = None
+    return ConfigDBConnector
 
 
 # XCVR type definition
@@ -32,6 +64,29 @@ QSFP_TYPE = "QSFP"
 OSFP_TYPE = "OSFP"
 QSFP_DD_TYPE = "QSFP_DD"
 
+# interval of the presence poll used when no line card provides QSFP_int notification
+PRESENCE_POLL_INTERVAL = 1
+# time in milliseconds get_change_event keeps collecting after the first change, so that
+# a line card or a batch of modules inserted together is reported as one event
+CHANGE_EVENT_COALESCE_WINDOW = 200
+# time in seconds reset_bulk() holds the ports in reset, ResetL needs at least 10us
+# per SFF-8679 and the write goes through the line card CPLD
+SFP_RESET_HOLD_TIME = 0.1
+# bring_up_cmis_ports(): time in seconds a module may take from lpmode release to ModuleReady,
+# and the interval between two polls of the module state
+CMIS_BRINGUP_TIMEOUT = 30
+CMIS_BRINGUP_POLL_INTERVAL = 0.1
+CMIS_MODULE_READY = 'ModuleReady'
+CMIS_MODULE_FAULT = 'ModuleFault'
+# state of the ports whose lpmode failed to be released, they aren't waited for
+CMIS_LPMODE_RELEASE_FAILED = 'LpModeReleaseFailed'
+# number of ports of a 400G (QSFP-DD) line card
+QSFP_DD_CARD_PORT_NUM = 4
+
+# thermals, fans and PSUs of one hwmon device share its bus and are read one after another
+# in a hardware snapshot, different devices are read in parallel
+HWMON_DEVICE_RE = re.compile(r'(/sys/class/hwmon/hwmon[0-9]+)')
+
 
 class Chassis(ChassisBase):
     """Platform-specific Chassis class"""
@@ -42,6 +97,8 @@ class Chassis(ChassisBase):
         super(Chassis, self).__init__()
         
         # Initialize SKU name and Platform name
+        # _device_metadata: DEVICE_METADATA read once for both, None until read
+        self._device_metadata = None
         self.sku_name = self._get_sku_name()
         self.platform_name = self._get_platform_name()
         self.name = self.sku_name
@@ -96,6 +153,9 @@ class Chassis(ChassisBase):
                 self._thermal_list.append(thermal)
         
         # init sfp list
+        # _sfp_adapter_list: the root I2C adapter each port sits behind, the muxes below one
+        # adapter switch segments of the same bus
+        self._sfp_adapter_list = []
         port_num = 1
         for sfpg_name in self.platdev.get_sfp_group_list():
             temp_type = self.platdev.get_sfp_group_type_by_name(sfpg_name)
@@ -124,19 +184,106 @@ class Chassis(ChassisBase):
                 sfp = Sfp(port_num, eeprom_path_list, sfp_type, self.platdev.get_sfp_ext_sysfile_list())
                 port_num += 1
                 self._sfp_list.append(sfp)
+                self._sfp_adapter_list.append(self.platdev.get_sfp_group_adapter_by_name(sfpg_name))
         
+        # DOM history, off until enable_dom_history() is called
+        self._dom_history = None
+        # latest HardwareSnapshot, see get_hardware_snapshot()
+        self._hw_snapshot = None
         self.init_global_port_presence()
 
-    def _get_sku_name(self):
-        p = subprocess.Popen(GET_HWSKU_CMD, shell=True, stdout=subprocess.PIPE)
+    def _read_machine_conf_platform(self):
+        try:
+            with open(MACHINE_CONF_FILE, 'r') as fd:
+                for line in fd:
+                    key, sep, value = line.strip().partition('=')
+                    if sep and key in MACHINE_CONF_PLATFORM_KEYS and value:
+                        return value
+        except (IOError, OSError):
+            pass
+        return None
+
+    def _get_device_metadata(self):
+        # hwsku and platform of DEVICE_METADATA|localhost, {} if not available
+        if self._device_metadata is None:
+            metadata = self._get_running_device_metadata()
+            if not metadata:
+                metadata = self._get_saved_device_metadata()
+            self._device_metadata = metadata
+        return self._device_metadata
+
+    def _get_running_device_metadata(self):
+        # hwsku and platform of DEVICE_METADATA|localhost in the running CONFIG_DB, {} if not available
+        ConfigDBConnector = _import_config_db_connector()
+        if ConfigDBConnector is None:
+            return {}
+        try:
+            config_db = ConfigDBConnector()
+            config_db.connect(wait_for_init=False)
+            localhost = config_db.get_entry('DEVICE_METADATA', 'localhost')
+        except Exception as ex:
+            logger.log_error("Unable to read DEVICE_METADATA from CONFIG_DB due to {}".format(repr(ex)))
+            return {}
+        return dict((key, localhost[key]) for key in ('hwsku', 'platform') if localhost.get(key))
+
+    def _get_saved_device_metadata(self):
+        # hwsku and platform of DEVICE_METADATA|localhost in config_db.json, {} if not available
+        # the cache holds the mtime of config_db.json it was made from
+        try:
+            config_db_mtime = os.stat(CONFIG_DB_FILE).st_mtime
+        except OSError:
+            return {}
+        try:
+            with open(DEVICE_METADATA_CACHE_FILE, 'r') as fd:
+                cache = json.load(fd)
+            if cache.get('config_db_mtime') == config_db_mtime:
+                return cache['metadata']
+        except (IOError, OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        try:
+            with open(CONFIG_DB_FILE, 'r') as fd:
+                localhost = json.load(fd).get('DEVICE_METADATA', {}).get('localhost', {})
+        except (IOError, OSError, ValueError, AttributeError) as ex:
+            logger.log_error("Unable to read {} due to {}".format(CONFIG_DB_FILE, repr(ex)))
+            return {}
+        metadata = dict((key, localhost[key]) for key in ('hwsku', 'platform') if key in localhost)
+
+        try:
+            cache_dir = os.path.dirname(DEVICE_METADATA_CACHE_FILE)
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'w') as tmp_fd:
+                    json.dump({'config_db_mtime': config_db_mtime, 'metadata': metadata}, tmp_fd)
+                os.rename(tmp_path, DEVICE_METADATA_CACHE_FILE)
+            except (IOError, OSError):
+                os.unlink(tmp_path)
+                raise
+        except (IOError, OSError):
+            # the next process reads config_db.json again
+            pass
+        return metadata
+
+    def _run_cfggen(self, cmd):
+        p = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE)
         out, err = p.communicate()
         return out.decode().rstrip('\n')
 
+    def _get_sku_name(self):
+        hwsku = self._get_device_metadata().get('hwsku')
+        if hwsku:
+            return hwsku
+        return self._run_cfggen(GET_HWSKU_CMD)
 
     def _get_platform_name(self):
-        p = subprocess.Popen(GET_PLATFORM_CMD, shell=True, stdout=subprocess.PIPE)
-        out, err = p.communicate()
-        return out.decode().rstrip('\n')
+        platform = os.environ.get('PLATFORM') or self._read_machine_conf_platform()
+        if not platform:
+            platform = self._get_device_metadata().get('platform')
+        if platform:
+            return platform
+        return self._run_cfggen(GET_PLATFORM_CMD)
 
     def get_name(self):
         """
@@ -223,13 +370,145 @@ class Chassis(ChassisBase):
     # Other methods
     ##############################################
 
+    def _read_card_presence(self, card):
+        # one read of the aggregated bitmap per card, fall back to the per-port
+        # present files when the driver doesn't provide it
+        # returns None if the bitmap or none of the present files can be read, i.e. the card is gone
+        if card['bitmap_file'] is not None:
+            return self.platdev.get_sfp_card_presence_bitmap(card)
+
+        bitmap = 0
+        readable = False
+        last_bitmap = self._card_pres_bitmap_dict.get(card['name'], 0)
+        for bit in range(0, card['port_num']):
+            port_num = card['port_start'] + bit
+            if port_num >= len(self._sfp_list):
+                continue
+            presence = self._sfp_list[port_num]._read_presence()
+            if presence is None:
+                # a single unreadable port keeps its last state rather than being reported removed
+                bitmap |= last_bitmap & (1 << bit)
+                continue
+            readable = True
+            if presence:
+                bitmap |= (1 << bit)
+        if not readable:
+            return None
+        return bitmap
+
+    def _scan_port_presence(self, card_list=None):
+        # XOR against the previous bitmap of each card, only the flipped bits are ports to report
+        # an unreadable card counts as an empty one, its state is kept in _card_pres_dict
+        port_dict = {}
+        if card_list is None:
+            card_list = self.platdev.get_sfp_card_list()
+        for card in card_list:
+            bitmap = self._read_card_presence(card)
+            if bitmap is None:
+                self._card_pres_dict[card['index']] = '0'
+                bitmap = 0
+            else:
+                self._card_pres_dict[card['index']] = '1'
+            changed = bitmap ^ self._card_pres_bitmap_dict.get(card['name'], 0)
+            self._card_pres_bitmap_dict[card['name']] = bitmap
+            bit = 0
+            while changed:
+                if changed & 0x1:
+                    port_num = card['port_start'] + bit
+                    presence = bool(bitmap & (1 << bit))
+                    if port_num < len(self._sfp_list):
+                        self._sfp_list[port_num]._update_presence(presence)
+                    port_dict[port_num] = '1' if presence else '0'
+                changed >>= 1
+                bit += 1
+        return port_dict
+
     def init_global_port_presence(self):
+        # _card_pres_dict: state of each card on the last scan
+        # _global_card_pres_dict: state of each card on the last reported event
+        self._card_pres_bitmap_dict = {}
+        self._card_pres_dict = {}
+        self._change_event_coalesce_window = CHANGE_EVENT_COALESCE_WINDOW
         for port_num in range(0, self.platdev.get_sfp_num()):
-            presence = self._sfp_list[port_num].get_presence()
-            if(presence):
-                self._global_port_pres_dict[port_num] = '1'
-            else:
-                self._global_port_pres_dict[port_num] = '0' 
+            self._global_port_pres_dict[port_num] = '0'
+        self._global_port_pres_dict.update(self._scan_port_presence())
+        self._global_card_pres_dict = dict(self._card_pres_dict)
+        self._init_card_int_poller()
+
+    def set_change_event_coalesce_window(self, window):
+        """
+        Sets the time get_change_event keeps collecting changes after the first one
+        Args:
+            window: Time in milliseconds, 0 to return on the first sweep with a change
+        """
+        self._change_event_coalesce_window = window
+
+    def _init_card_int_poller(self):
+        # _card_int_fd_dict: fd of QSFP_int -> card, the fd is readable with POLLPRI
+        # after the driver calls sysfs_notify() on it
+        self._card_int_poller = None
+        self._card_int_fd_dict = {}
+        for card in self.platdev.get_sfp_card_list():
+            if card['int_file'] is None:
+                continue
+            try:
+                fd = os.open(card['int_file'], os.O_RDONLY)
+                # sysfs only notifies a file which has been read since the last notification
+                os.read(fd, 4096)
+            except (IOError, OSError) as ex:
+                logger.log_error("Unable to open {} due to {}".format(card['int_file'], repr(ex)))
+                continue
+            if self._card_int_poller is None:
+                self._card_int_poller = select.poll()
+            self._card_int_poller.register(fd, select.POLLPRI | select.POLLERR)
+            self._card_int_fd_dict[fd] = card
+
+    def _drain_card_int(self):
+        # the changes behind pending notifications were picked up by a full sweep,
+        # re-arm them so the next call doesn't wake up for nothing
+        if self._card_int_poller is None:
+            return
+        try:
+            event_list = self._card_int_poller.poll(0)
+        except select.error:
+            return
+        for fd, event in event_list:
+            self._rearm_card_int(fd)
+
+    def _collect_change_event(self, port_dict, end_time):
+        # full sweeps until the coalescing window is over, then report only the net changes
+        # against the last event, a port plugged out and in again within the window is not reported
+        # end_time: the window doesn't go past it, None for no limit
+        window = self._change_event_coalesce_window / 1000.0
+        if end_time is not None:
+            window = min(window, end_time - time.time())
+        if window > 0:
+            time.sleep(window)
+            self._drain_card_int()
+            port_dict.update(self._scan_port_presence())
+
+        event_dict = {'sfp': {}}
+        for port_num in port_dict:
+            if port_dict[port_num] != self._global_port_pres_dict.get(port_num):
+                event_dict['sfp'][port_num] = port_dict[port_num]
+        self._global_port_pres_dict.update(event_dict['sfp'])
+
+        module_dict = {}
+        for card_index in self._card_pres_dict:
+            if self._card_pres_dict[card_index] != self._global_card_pres_dict.get(card_index):
+                module_dict[card_index] = self._card_pres_dict[card_index]
+        if len(module_dict) > 0:
+            self._global_card_pres_dict.update(module_dict)
+            event_dict['module'] = module_dict
+
+        return event_dict
+
+    def _rearm_card_int(self, fd):
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.read(fd, 4096)
+        except (IOError, OSError) as ex:
+            logger.log_error("Unable to read {} due to {}".format(self._card_int_fd_dict[fd]['int_file'], repr(ex)))
 
     def get_change_event(self, timeout=0):
         """
@@ -251,6 +530,8 @@ class Chassis(ChassisBase):
                   Ex. {'fan':{'0':'0', '2':'1'}, 'sfp':{'11':'0'}}
                       indicates that fan 0 has been removed, fan 2
                       has been inserted and sfp 11 has been removed.
+                  A line card inserted or removed is reported under 'module'
+                  with the line card index, together with all its ports.
                   Specifically for SFP event, besides SFP plug in and plug out,
                   there are some other error event could be raised from SFP, when 
                   these error happened, SFP eeprom will not be avalaible, XCVRD shall
@@ -261,24 +542,404 @@ class Chassis(ChassisBase):
                       status='5' High Temperature,
                       status='6' Bad cable.
         """
-        port_dict = {}
+        if timeout:
+            end_time = time.time() + timeout / 1000.0
+        else:
+            end_time = None
+
+        # cards without QSFP_int are rescanned on every wakeup
+        card_list = self.platdev.get_sfp_card_list()
+        polled_card_list = [card for card in card_list if card not in self._card_int_fd_dict.values()]
+        port_dict = self._scan_port_presence()
         while True:
-            for port_num in range(0, self.platdev.get_sfp_num()):
-                presence = self._sfp_list[port_num].get_presence()
-                if(presence and self._global_port_pres_dict[port_num] == '0'):
-                    self._global_port_pres_dict[port_num] = '1'
-                    port_dict[port_num] = '1'
-                elif(not presence and
-                     self._global_port_pres_dict[port_num] == '1'):
-                    self._global_port_pres_dict[port_num] = '0'
-                    port_dict[port_num] = '0'
-
-                if(len(port_dict) > 0):
-                    return True, {'sfp':port_dict}
-
-            time.sleep(1)
+            while len(port_dict) == 0 and self._card_pres_dict == self._global_card_pres_dict:
+                if end_time is None:
+                    wait_time = None
+                else:
+                    wait_time = end_time - time.time()
+                    if wait_time <= 0:
+                        break
+
+                if self._card_int_poller is None:
+                    if wait_time is None or wait_time > PRESENCE_POLL_INTERVAL:
+                        wait_time = PRESENCE_POLL_INTERVAL
+                    time.sleep(wait_time)
+                    port_dict = self._scan_port_presence()
+                    continue
+
+                if len(polled_card_list) > 0 and (wait_time is None or wait_time > PRESENCE_POLL_INTERVAL):
+                    wait_time = PRESENCE_POLL_INTERVAL
+                try:
+                    event_list = self._card_int_poller.poll(None if wait_time is None else int(wait_time * 1000))
+                except select.error as ex:
+                    logger.log_error("Fail to poll QSFP_int due to {}".format(repr(ex)))
+                    return False, {'sfp':{}}
+
+                signalled_card_list = list(polled_card_list)
+                for fd, event in event_list:
+                    self._rearm_card_int(fd)
+                    signalled_card_list.append(self._card_int_fd_dict[fd])
+                port_dict = self._scan_port_presence(signalled_card_list)
+
+            if len(port_dict) == 0 and self._card_pres_dict == self._global_card_pres_dict:
+                return True, {'sfp':{}}
+            event_dict = self._collect_change_event(port_dict, end_time)
+            if len(event_dict['sfp']) > 0 or 'module' in event_dict:
+                return True, event_dict
+            # the changes were undone within the window, wait for the next one
+            port_dict = {}
             
             
+    def _sweep_sfp_by_adapter(self, port_list, sfp_func):
+        # ports behind the same I2C adapter are accessed one after another, the muxes only
+        # switch segments of its bus, each other adapter is swept by its own worker thread
+        # all line cards of this platform sit behind PCA9548_0x73 on one adapter, so the
+        # sweep runs in the calling thread
+        result_dict = {}
+        time_dict = {}
+        adapter_dict = {}
+        for port_num in port_list:
+            adapter_dict.setdefault(self._sfp_adapter_list[port_num], []).append(port_num)
+
+        def sweep_adapter(adapter_port_list):
+            for port_num in adapter_port_list:
+                start_time = time.time()
+                try:
+                    result_dict[port_num] = sfp_func(self._sfp_list[port_num])
+                except Exception as ex:
+                    logger.log_error("Fail to access sfp{} due to {}".format(port_num, repr(ex)))
+                    result_dict[port_num] = None
+                time_dict[port_num] = time.time() - start_time
+
+        adapter_port_lists = list(adapter_dict.values())
+        if len(adapter_port_lists) <= 1:
+            for adapter_port_list in adapter_port_lists:
+                sweep_adapter(adapter_port_list)
+            return result_dict, time_dict
+
+        worker_list = []
+        for adapter_port_list in adapter_port_lists:
+            worker = threading.Thread(target=sweep_adapter, args=(adapter_port_list,))
+            worker.daemon = True
+            worker.start()
+            worker_list.append(worker)
+        for worker in worker_list:
+            worker.join()
+
+        return result_dict, time_dict
+
+    def get_transceiver_bulk_status_all(self, port_list=None):
+        """
+        Retrieves transceiver bulk status of SFPs, ports behind different I2C
+        adapters are swept in parallel
+        Args:
+            port_list: A list of port index (start from 0), all ports if None
+        Returns:
+            A tuple (dict, dict):
+                - port index : dict returned by Sfp.get_transceiver_bulk_status(),
+                  None if the port failed to be read
+                - port index : time in seconds spent on reading the port
+        """
+        if port_list is None:
+            port_list = range(0, len(self._sfp_list))
+
+        return self._sweep_sfp_by_adapter(port_list, lambda sfp: sfp.get_transceiver_bulk_status())
+
+    def enable_dom_history(self, tiers=DOM_HISTORY_TIERS, port_list=None):
+        """
+        Starts keeping the DOM values read by Sfp.get_transceiver_bulk_status() of the given
+        ports in a fixed size history of each port, see dom_history.DomHistory, the ports
+        not given aren't recorded
+        Args:
+            tiers: A list of (step in seconds, number of samples) from the finest to the coarsest
+            port_list: A list of port index (start from 0), all ports if None
+        """
+        if port_list is None:
+            port_list = range(0, len(self._sfp_list))
+        port_set = set(port_list)
+        self._dom_history = DomHistory(tiers)
+        for port_num, sfp in enumerate(self._sfp_list):
+            sfp.set_dom_history(self._dom_history if port_num in port_set else None, port_num)
+
+    def get_dom_history(self, port_num, key, tier=0, start=None, end=None):
+        """
+        Retrieves the history of one DOM value of a port, see DomHistory.query()
+        Args:
+            port_num: port index (start from 0)
+            key: key of the value in the dict of Sfp.get_transceiver_bulk_status(), e.g. 'rx1power'
+            tier: index of the tier, 0 for the finest one
+            start, end: Time range in seconds since the epoch, None for no limit
+        Returns:
+            A list of (time of the sample, value) from the oldest to the newest,
+            None if the history is off or the value isn't recorded
+        """
+        if self._dom_history is None:
+            return None
+        return self._dom_history.query(port_num, key, tier, start, end)
+
+    def get_dom_threshold_violations(self, dom_info=None):
+        """
+        Retrieves the DOM values in violation of the alarm/warning thresholds of SFPs,
+        all ports and lanes are evaluated in one pass, see dom_alarm.get_threshold_violations()
+        Args:
+            dom_info: A dict, port index (start from 0) : dict returned by
+                      Sfp.get_transceiver_bulk_status(), e.g. the first dict returned by
+                      get_transceiver_bulk_status_all(), all ports are read if None
+        Returns:
+            A dict which contains only the ports in violation,
+            port index : {key of the value in the bulk status dict : (band, value, threshold)}
+        """
+        if dom_info is None:
+            dom_info, time_dict = self.get_transceiver_bulk_status_all()
+        port_list = [port_num for port_num in dom_info if dom_info[port_num] is not None]
+        # thresholds are served from the cache of each Sfp after the first read
+        threshold_info, time_dict = self._sweep_sfp_by_adapter(port_list,
+                                                              lambda sfp: sfp.get_transceiver_threshold_info())
+
+        return get_threshold_violations(dom_info, threshold_info)
+
+    def set_dom_snapshot_window(self, window):
+        """
+        Sets the DOM snapshot window of all SFPs, see Sfp.set_dom_snapshot_window()
+        Args:
+            window: Time in seconds, 0 to read every field from the module
+        """
+        for sfp in self._sfp_list:
+            sfp.set_dom_snapshot_window(window)
+
+    def _sweep_by_device(self, task_list):
+        # task_list: a list of (sysfs path, function), the functions of one hwmon device run
+        # one after another and each device is swept by its own worker thread
+        result_list = [None] * len(task_list)
+        device_dict = {}
+        for idx in range(0, len(task_list)):
+            match = HWMON_DEVICE_RE.match(task_list[idx][0] or '')
+            device = match.group(1) if match is not None else task_list[idx][0]
+            device_dict.setdefault(device, []).append(idx)
+
+        def sweep_device(idx_list):
+            for idx in idx_list:
+                try:
+                    result_list[idx] = task_list[idx][1]()
+                except Exception as ex:
+                    logger.log_error("Fail to read {} due to {}".format(task_list[idx][0], repr(ex)))
+
+        if len(device_dict) == 1:
+            # e.g. everything behind the BMC, no thread needed
+            sweep_device(list(device_dict.values())[0])
+            return result_list
+        worker_list = []
+        for idx_list in device_dict.values():
+            worker = threading.Thread(target=sweep_device, args=(idx_list,))
+            worker.daemon = True
+            worker.start()
+            worker_list.append(worker)
+        for worker in worker_list:
+            worker.join()
+
+        return result_list
+
+    def get_hardware_snapshot(self, max_age=0):
+        """
+        Retrieves every thermal reading, fan presence/status/speed and PSU presence/power good/
+        voltage/current/power/temperature in one sweep, independent hwmon devices are read in
+        parallel. The getters of each Thermal, Fan and Psu are served from the snapshot during
+        their snapshot window, see set_hardware_snapshot_window()
+        Args:
+            max_age: Time in seconds, the latest snapshot is returned as it is if it's younger
+        Returns:
+            A HardwareSnapshot namedtuple (timestamp, thermals, fans, psus) of tuples of
+            ThermalReading, FanReading and PsuReading namedtuples, see hw_snapshot
+        """
+        snapshot = self._hw_snapshot
+        if snapshot is not None and 0 <= time.time() - snapshot.timestamp < max_age:
+            return snapshot
+
+        psu_fan_list = []
+        for psu in self._psu_list:
+            psu_fan_list.extend(psu.get_all_fans())
+        timestamp = time.time()
+        task_list = []
+        for thermal in self._thermal_list:
+            task_list.append((thermal.filepath, lambda obj=thermal: obj.read_snapshot_reading(timestamp)))
+        for fan in self._fan_list + psu_fan_list:
+            task_list.append((fan.attr_path, lambda obj=fan: obj.read_snapshot_reading(timestamp)))
+        for psu in self._psu_list:
+            task_list.append((psu.attr_path, lambda obj=psu: obj.read_snapshot_reading(timestamp)))
+        result_list = self._sweep_by_device(task_list)
+
+        thermal_num = len(self._thermal_list)
+        fan_num = len(self._fan_list) + len(psu_fan_list)
+        snapshot = HardwareSnapshot(timestamp, tuple(result_list[0 : thermal_num]),
+                                    tuple(result_list[thermal_num : thermal_num + fan_num]),
+                                    tuple(result_list[thermal_num + fan_num :]))
+        self._hw_snapshot = snapshot
+        return snapshot
+
+    def set_hardware_snapshot_window(self, window):
+        """
+        Sets the time the getters of all thermals, fans and PSUs are served from the latest
+        hardware snapshot, see SnapshotReader.set_snapshot_window()
+        Args:
+            window: Time in seconds, 0 to read the hardware on every call
+        """
+        for psu in self._psu_list:
+            psu.set_snapshot_window(window)
+            for fan in psu.get_all_fans():
+                fan.set_snapshot_window(window)
+        for obj in self._thermal_list + self._fan_list:
+            obj.set_snapshot_window(window)
+
+    def get_attr_cache_stats(self):
+        """
+        Retrieves the hit/miss counters of the sysfs attribute cache, the TTL policies
+        are platDev.ATTR_TTL_POLICY_LIST
+        Returns:
+            A dict, policy name : {'ttl': time in seconds, 'hits': integer, 'misses': integer}
+        """
+        return get_attr_cache_stats()
+
+    def _group_ports_by_card(self, ports):
+        # returns a list of (card, bitmap of the given ports on the card) and a list of
+        # the given ports which aren't on any card
+        card_mask_list = []
+        unknown_port_list = list(ports)
+        for card in self.platdev.get_sfp_card_list():
+            mask = 0
+            for port_num in ports:
+                bit = port_num - card['port_start']
+                if 0 <= bit < card['port_num']:
+                    mask |= (1 << bit)
+                    unknown_port_list.remove(port_num)
+            if mask != 0:
+                card_mask_list.append((card, mask))
+        return card_mask_list, unknown_port_list
+
+    def _get_card_mask_ports(self, card, mask):
+        return [card['port_start'] + bit for bit in range(0, card['port_num']) if mask & (1 << bit)]
+
+    def set_lpmode_bulk(self, ports, mode):
+        """
+        Sets the lpmode of several SFPs, ports on the same line card are set with
+        one write of the card CPLD
+        Args:
+            ports: A list of port index (start from 0)
+            mode: A Boolean, True to enable lpmode, False to disable it
+        Returns:
+            A boolean, True if all ports are set successfully, False if not
+        """
+        return len(self._set_lpmode_bulk(ports, mode)) == 0
+
+    def _set_lpmode_bulk(self, ports, mode):
+        # returns the list of the given ports which failed to be set
+        card_mask_list, failed_list = self._group_ports_by_card(ports)
+        for port_num in failed_list:
+            logger.log_error("Invalid port {} to set lpmode".format(port_num))
+
+        for card, mask in card_mask_list:
+            if self.platdev.set_sfp_card_lpmode_bitmap(card, mask, mask if mode else 0):
+                continue
+            # the driver doesn't provide the bulk attribute or it failed, set the ports one by one
+            for port_num in self._get_card_mask_ports(card, mask):
+                if not self._sfp_list[port_num].set_lpmode(mode):
+                    failed_list.append(port_num)
+        return failed_list
+
+    def reset_bulk(self, ports):
+        """
+        Resets several SFPs, ports on the same line card are put into and out of
+        reset with one write of the card CPLD each, and all of them share one hold time
+        Args:
+            ports: A list of port index (start from 0)
+        Returns:
+            A boolean, True if all ports are reset successfully, False if not
+        """
+        result = True
+        card_mask_list, unknown_port_list = self._group_ports_by_card(ports)
+        for port_num in unknown_port_list:
+            logger.log_error("Invalid port {} to reset".format(port_num))
+            result = False
+
+        held_list = []
+        for card, mask in card_mask_list:
+            if self.platdev.set_sfp_card_reset_bitmap(card, mask, mask):
+                held_list.append((card, mask))
+                continue
+            # the driver doesn't provide the bulk attribute or it failed, reset the ports one by one
+            for port_num in self._get_card_mask_ports(card, mask):
+                if not self._sfp_list[port_num].reset():
+                    result = False
+
+        if len(held_list) == 0:
+            return result
+
+        time.sleep(SFP_RESET_HOLD_TIME)
+        for card, mask in held_list:
+            if not self.platdev.set_sfp_card_reset_bitmap(card, mask, 0):
+                logger.log_error("Fail to release reset of {}".format(card['name']))
+                result = False
+            for port_num in self._get_card_mask_ports(card, mask):
+                self._sfp_list[port_num]._invalidate_static_info()
+        return result
+
+    def bring_up_cmis_ports(self, port_list=None, timeout=CMIS_BRINGUP_TIMEOUT, progress=None):
+        """
+        Releases the lpmode of QSFP-DD modules and waits for them to reach ModuleReady.
+        The lpmode of all ports is released at once and every poll reads the module state
+        of all pending ports in one sweep, so the bring-up takes as long as the slowest
+        module rather than the sum of all
+        Args:
+            port_list: A list of port index (start from 0), all ports of 400G line cards if None,
+                       ports which are absent or not QSFP-DD are skipped
+            timeout: Time in seconds each port may take to reach ModuleReady after its lpmode is released
+            progress: A function called as progress(port index, module state, elapsed seconds)
+                      whenever the module state of a port changes, None to disable
+        Returns:
+            A dict, port index : (module state, elapsed seconds) on which the port stopped,
+            the state is 'ModuleReady' on success, None if it can't be read and
+            'LpModeReleaseFailed' if the lpmode of the port failed to be released
+        """
+        if port_list is None:
+            port_list = []
+            for card in self.platdev.get_sfp_card_list():
+                if card['port_num'] == QSFP_DD_CARD_PORT_NUM:
+                    port_list.extend(range(card['port_start'], card['port_start'] + card['port_num']))
+        port_list = [port_num for port_num in port_list if port_num < len(self._sfp_list)]
+        type_dict, time_dict = self._sweep_sfp_by_adapter(port_list,
+                                                         lambda sfp: sfp.sfp_type if sfp.get_presence() else None)
+        port_list = [port_num for port_num in port_list if type_dict.get(port_num) == QSFP_DD_TYPE]
+
+        state_dict = {}
+        if len(port_list) == 0:
+            return state_dict
+
+        start_time = time.time()
+        failed_list = self._set_lpmode_bulk(port_list, False)
+        elapsed = time.time() - start_time
+        for port_num in failed_list:
+            if progress is not None:
+                progress(port_num, CMIS_LPMODE_RELEASE_FAILED, elapsed)
+            state_dict[port_num] = (CMIS_LPMODE_RELEASE_FAILED, elapsed)
+        pending_list = [port_num for port_num in port_list if port_num not in state_dict]
+        while len(pending_list) > 0:
+            result_dict, time_dict = self._sweep_sfp_by_adapter(pending_list, lambda sfp: sfp.get_module_state())
+            elapsed = time.time() - start_time
+            for port_num in list(pending_list):
+                state = result_dict.get(port_num)
+                if progress is not None and (port_num not in state_dict or state_dict[port_num][0] != state):
+                    progress(port_num, state, elapsed)
+                state_dict[port_num] = (state, elapsed)
+                if state in (CMIS_MODULE_READY, CMIS_MODULE_FAULT) or elapsed >= timeout:
+                    pending_list.remove(port_num)
+            if len(pending_list) > 0:
+                time.sleep(CMIS_BRINGUP_POLL_INTERVAL)
+
+        for port_num in port_list:
+            state, elapsed = state_dict[port_num]
+            if state != CMIS_MODULE_READY:
+                logger.log_error("sfp{} stopped in state {} after {:.1f} seconds".format(port_num, state, elapsed))
+        return state_dict
+
     def sfp_debugger(self):
         """
         Try to show all parameters read from eeprom with sfp methods
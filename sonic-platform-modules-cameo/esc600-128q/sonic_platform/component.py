@@ -10,6 +10,7 @@
 try:
     import os
     from sonic_platform_base.component_base import ComponentBase
+    from sonic_platform.sysfs_attr import read_attr
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
@@ -28,14 +29,9 @@ class Component(ComponentBase):
         rv = 'ERR'
         if (not os.path.isfile(syspath)):
             return rv
-        # noinspection PyBroadException
-        try:
-            with open(syspath, 'r') as fd:
-                rv = fd.read()
-        except Exception as error:
-            rv = 'ERR'
-        rv = rv.rstrip('\r\n')
-        rv = rv.lstrip(" ")
+        data = read_attr(syspath)
+        if data is not None:
+            rv = data.lstrip(" ")
         return rv
 
     def _get_bios_version(self):
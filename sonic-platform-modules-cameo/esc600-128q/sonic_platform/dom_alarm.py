@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+#############################################################################
+#
+# Module contains the evaluation of DOM values against the alarm/warning
+# thresholds of all ports and lanes at once
+#
+#############################################################################
+
+try:
+    import re
+    import math
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found")
+
+# numpy is optional, the same evaluation runs in plain python without it
+# it's imported on the first evaluation rather than with the platform package, since importing
+# it takes longer than constructing the whole Chassis
+numpy = None
+_numpy_checked = False
+
+def _import_numpy():
+    global numpy, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+    return numpy
+
+DOM_LANE_NUM = 8
+
+# DOM_METRIC_LIST
+#   (prefix of the threshold keys, keys in the dict of get_transceiver_bulk_status() of each lane)
+#   a module level metric has one key, which is placed on lane 1
+DOM_METRIC_LIST = [
+    ('temp', ['temperature']),
+    ('vcc', ['voltage']),
+    ('rxpower', ['rx{}power'.format(lane) for lane in range(1, DOM_LANE_NUM + 1)]),
+    ('txpower', ['tx{}power'.format(lane) for lane in range(1, DOM_LANE_NUM + 1)]),
+    ('txbias', ['tx{}bias'.format(lane) for lane in range(1, DOM_LANE_NUM + 1)]),
+]
+
+# order of the bands in the threshold array, an alarm is reported over a warning of the same value
+DOM_BAND_LIST = ['highwarning', 'lowwarning', 'highalarm', 'lowalarm']
+HIGH_WARNING = 0
+LOW_WARNING = 1
+HIGH_ALARM = 2
+LOW_ALARM = 3
+
+# leading number of a DOM string such as '-0.8486', '12.3380mA', '3.3Volts'
+DOM_VALUE_RE = re.compile(r'\s*([-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)')
+NAN = float('nan')
+
+def dom_value_to_float(value):
+    # NaN for 'N/A', '-inf' and anything else which isn't a number, NaN never violates a threshold
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        match = DOM_VALUE_RE.match(str(value))
+        if match is None:
+            return NAN
+        number = float(match.group(1))
+    if math.isinf(number):
+        return NAN
+    return number
+
+def _build_value_array(dom_info):
+    # ports x lanes x metrics
+    lane_list = []
+    for lane in range(0, DOM_LANE_NUM):
+        metric_list = []
+        for prefix, key_list in DOM_METRIC_LIST:
+            if lane < len(key_list):
+                metric_list.append(dom_value_to_float(dom_info.get(key_list[lane], NAN)))
+            else:
+                metric_list.append(NAN)
+        lane_list.append(metric_list)
+    return lane_list
+
+def _build_threshold_array(threshold_info):
+    # ports x metrics x bands
+    return [[dom_value_to_float(threshold_info.get(prefix + band, NAN)) for band in DOM_BAND_LIST]
+            for prefix, key_list in DOM_METRIC_LIST]
+
+def _evaluate_numpy(value_array, threshold_array):
+    # returns (port, lane, metric, band) of every value in violation
+    values = numpy.array(value_array, dtype=float)
+    thresholds = numpy.array(threshold_array, dtype=float)[:, numpy.newaxis, :, :]
+    band_array = numpy.full(values.shape, -1, dtype=numpy.int8)
+    with numpy.errstate(invalid='ignore'):
+        band_array[values > thresholds[..., HIGH_WARNING]] = HIGH_WARNING
+        band_array[values < thresholds[..., LOW_WARNING]] = LOW_WARNING
+        band_array[values > thresholds[..., HIGH_ALARM]] = HIGH_ALARM
+        band_array[values < thresholds[..., LOW_ALARM]] = LOW_ALARM
+    port_idx, lane_idx, metric_idx = numpy.nonzero(band_array >= 0)
+    band_idx = band_array[port_idx, lane_idx, metric_idx]
+    return zip(port_idx.tolist(), lane_idx.tolist(), metric_idx.tolist(), band_idx.tolist())
+
+def _evaluate_python(value_array, threshold_array):
+    violation_list = []
+    for port_idx in range(0, len(value_array)):
+        thresholds = threshold_array[port_idx]
+        for lane_idx in range(0, DOM_LANE_NUM):
+            values = value_array[port_idx][lane_idx]
+            for metric_idx in range(0, len(DOM_METRIC_LIST)):
+                value = values[metric_idx]
+                band = thresholds[metric_idx]
+                # comparisons with NaN are False, same as in numpy
+                if value < band[LOW_ALARM]:
+                    violation_list.append((port_idx, lane_idx, metric_idx, LOW_ALARM))
+                elif value > band[HIGH_ALARM]:
+                    violation_list.append((port_idx, lane_idx, metric_idx, HIGH_ALARM))
+                elif value < band[LOW_WARNING]:
+                    violation_list.append((port_idx, lane_idx, metric_idx, LOW_WARNING))
+                elif value > band[HIGH_WARNING]:
+                    violation_list.append((port_idx, lane_idx, metric_idx, HIGH_WARNING))
+    return violation_list
+
+def get_threshold_violations(dom_info_dict, threshold_info_dict):
+    """
+    Evaluates the DOM values of all ports and lanes against their thresholds in one pass
+    Args:
+        dom_info_dict: A dict, port index : dict returned by Sfp.get_transceiver_bulk_status()
+        threshold_info_dict: A dict, port index : dict returned by Sfp.get_transceiver_threshold_info()
+    Returns:
+        A dict which contains only the ports in violation,
+        port index : {key of the value in the bulk status dict : (band, value, threshold)}
+        e.g. {3: {'rx2power': ('lowalarm', -21.3, -18.0)}}, band is one of 'highalarm',
+        'lowalarm', 'highwarning', 'lowwarning', an alarm is reported instead of a warning
+    """
+    port_list = [port_num for port_num in sorted(dom_info_dict.keys())
+                 if dom_info_dict[port_num] is not None and threshold_info_dict.get(port_num) is not None]
+    if len(port_list) == 0:
+        return {}
+
+    value_array = [_build_value_array(dom_info_dict[port_num]) for port_num in port_list]
+    threshold_array = [_build_threshold_array(threshold_info_dict[port_num]) for port_num in port_list]
+    if _import_numpy() is not None:
+        violation_list = _evaluate_numpy(value_array, threshold_array)
+    else:
+        violation_list = _evaluate_python(value_array, threshold_array)
+
+    violation_dict = {}
+    for port_idx, lane_idx, metric_idx, band_idx in violation_list:
+        port_num = port_list[port_idx]
+        key = DOM_METRIC_LIST[metric_idx][1][lane_idx]
+        violation_dict.setdefault(port_num, {})[key] = (DOM_BAND_LIST[band_idx],
+                                                        value_array[port_idx][lane_idx][metric_idx],
+                                                        threshold_array[port_idx][metric_idx][band_idx])
+    return violation_dict
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+#############################################################################
+#
+# Module contains a fixed size history of the DOM values of each port,
+# kept in ring buffers of several resolutions
+#
+#############################################################################
+
+try:
+    import time
+    from array import array
+    from sonic_platform.dom_alarm import DOM_METRIC_LIST, dom_value_to_float
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found")
+
+# DOM_HISTORY_TIERS
+#   (step in seconds, number of samples) of each tier from the finest to the coarsest,
+#   a sample of a tier is the average of the values recorded during its step
+#   default: 1 minute for 1 hour, 5 minutes for 24 hours, xcvrd reads the DOM once a minute,
+#   that's 348 samples of 2 bytes per value, 9.7 KB per QSFP port (14 values) and
+#   18 KB per QSFP-DD port (26 values), 2.3 MB for 128 QSFP-DD ports
+DOM_HISTORY_TIERS = ((60, 60), (300, 288))
+
+# samples are stored as int16 of value * scale of the metric:
+#   temperature 0.01 C, voltage 1 mV, power 0.01 dBm, bias 0.01 mA
+DOM_HISTORY_SCALE_DICT = {
+    'temp': 100,
+    'vcc': 1000,
+    'rxpower': 100,
+    'txpower': 100,
+    'txbias': 100,
+}
+DOM_HISTORY_UNKNOWN = -32768
+DOM_HISTORY_MAX = 32767
+
+# index of the state of a tier
+TIER_STEP = 0
+TIER_SIZE = 1
+TIER_BUCKET = 2
+TIER_SUM = 3
+TIER_COUNT = 4
+TIER_RING = 5
+
+class PortHistory(object):
+    """History of all DOM values of one port"""
+    __slots__ = ('lane_num', 'key_list', 'scale_list', 'tier_list')
+
+    def __init__(self, lane_num, tiers):
+        self.lane_num = lane_num
+        self.key_list = []
+        self.scale_list = []
+        for prefix, lane_key_list in DOM_METRIC_LIST:
+            for key in lane_key_list[0 : lane_num]:
+                self.key_list.append(key)
+                self.scale_list.append(DOM_HISTORY_SCALE_DICT[prefix])
+        # ring of a tier: the values of all keys of one sample after the other
+        #   [step, number of samples, current bucket, sums of the bucket, counts of the bucket, ring]
+        series_num = len(self.key_list)
+        self.tier_list = []
+        for step, size in tiers:
+            self.tier_list.append([step, size, None, [0.0] * series_num, [0] * series_num,
+                                   array('h', [DOM_HISTORY_UNKNOWN]) * (size * series_num)])
+
+def _pack(value, scale):
+    packed = int(round(value * scale))
+    return max(-DOM_HISTORY_MAX, min(DOM_HISTORY_MAX, packed))
+
+class DomHistory(object):
+    """Fixed size DOM history of all ports"""
+    def __init__(self, tiers=DOM_HISTORY_TIERS):
+        self.tiers = tuple(tiers)
+        self._port_dict = {}
+
+    def _write_slot(self, tier, bucket, sample):
+        series_num = len(tier[TIER_SUM])
+        start = (bucket % tier[TIER_SIZE]) * series_num
+        tier[TIER_RING][start : start + series_num] = sample
+
+    def _flush(self, history, tier):
+        # store the average of the current bucket and start an empty one
+        sample = array('h')
+        for idx in range(0, len(history.key_list)):
+            if tier[TIER_COUNT][idx] > 0:
+                sample.append(_pack(tier[TIER_SUM][idx] / tier[TIER_COUNT][idx], history.scale_list[idx]))
+            else:
+                sample.append(DOM_HISTORY_UNKNOWN)
+            tier[TIER_SUM][idx] = 0.0
+            tier[TIER_COUNT][idx] = 0
+        self._write_slot(tier, tier[TIER_BUCKET], sample)
+
+    def record(self, port_num, dom_info, lane_num, now=None):
+        """
+        Records the DOM values of a port
+        Args:
+            port_num: port index (start from 0)
+            dom_info: A dict returned by Sfp.get_transceiver_bulk_status()
+            lane_num: number of lanes of the module, the history of the port restarts
+                      when it changes
+            now: Time of the values in seconds since the epoch, the current time if None
+        """
+        if now is None:
+            now = time.time()
+        history = self._port_dict.get(port_num)
+        if history is None or history.lane_num != lane_num:
+            history = PortHistory(lane_num, self.tiers)
+            self._port_dict[port_num] = history
+
+        value_list = [dom_value_to_float(dom_info.get(key)) for key in history.key_list]
+        unknown_sample = array('h', [DOM_HISTORY_UNKNOWN]) * len(value_list)
+        for tier in history.tier_list:
+            bucket = int(now // tier[TIER_STEP])
+            if tier[TIER_BUCKET] is None:
+                tier[TIER_BUCKET] = bucket
+            elif bucket > tier[TIER_BUCKET]:
+                self._flush(history, tier)
+                # buckets without any record
+                for skipped in range(tier[TIER_BUCKET] + 1, min(bucket, tier[TIER_BUCKET] + 1 + tier[TIER_SIZE])):
+                    self._write_slot(tier, skipped, unknown_sample)
+                tier[TIER_BUCKET] = bucket
+            elif bucket < tier[TIER_BUCKET]:
+                # the clock went back, the stored samples can't be placed any more
+                tier[TIER_RING] = unknown_sample * tier[TIER_SIZE]
+                tier[TIER_SUM] = [0.0] * len(value_list)
+                tier[TIER_COUNT] = [0] * len(value_list)
+                tier[TIER_BUCKET] = bucket
+
+            for idx in range(0, len(value_list)):
+                # NaN ('N/A', -inf) isn't recorded
+                if value_list[idx] == value_list[idx]:
+                    tier[TIER_SUM][idx] += value_list[idx]
+                    tier[TIER_COUNT][idx] += 1
+
+    def query(self, port_num, key, tier=0, start=None, end=None):
+        """
+        Retrieves the history of one DOM value of a port
+        Args:
+            port_num: port index (start from 0)
+            key: key of the value in the dict of Sfp.get_transceiver_bulk_status(), e.g. 'rx1power'
+            tier: index of the tier in tiers, 0 for the finest one
+            start, end: Time range in seconds since the epoch, None for no limit
+        Returns:
+            A list of (time of the sample, value) from the oldest to the newest, the newest
+            sample is the average of the step in progress, None if the key isn't recorded
+        """
+        history = self._port_dict.get(port_num)
+        if history is None or key not in history.key_list or not 0 <= tier < len(history.tier_list):
+            return None
+
+        idx = history.key_list.index(key)
+        scale = float(history.scale_list[idx])
+        series_num = len(history.key_list)
+        step, size, last_bucket, sum_list, count_list, ring = history.tier_list[tier]
+        sample_list = []
+        if last_bucket is None:
+            return sample_list
+        for bucket in range(last_bucket - size + 1, last_bucket):
+            packed = ring[(bucket % size) * series_num + idx]
+            if packed != DOM_HISTORY_UNKNOWN:
+                sample_list.append((bucket * step, packed / scale))
+        if count_list[idx] > 0:
+            sample_list.append((last_bucket * step, sum_list[idx] / count_list[idx]))
+
+        return [sample for sample in sample_list
+                if (start is None or sample[0] >= start) and (end is None or sample[0] <= end)]
+
+    def get_memory_size(self):
+        """
+        Retrieves the size of all ring buffers
+
+        Returns:
+            An integer, size in bytes
+        """
+        size = 0
+        for history in self._port_dict.values():
+            for tier in history.tier_list:
+                size += tier[TIER_RING].itemsize * len(tier[TIER_RING])
+        return size
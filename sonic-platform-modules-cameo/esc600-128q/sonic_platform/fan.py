@@ -3,6 +3,8 @@
 try:
     from sonic_py_common.logger import Logger
     from sonic_platform_base.fan_base import FanBase
+    from sonic_platform.sysfs_attr import read_attr
+    from sonic_platform.hw_snapshot import SnapshotReader, FanReading
 except ImportError as e:
     raise ImportError (str(e) + "- required module not found")
 
@@ -11,9 +13,13 @@ logger = Logger(SYSLOG_IDENTIFIER)
 
 FAN_POSITION_NAME = ["Front","Rear"]
 
-class Fan(FanBase):
+class Fan(FanBase, SnapshotReader):
     """Platform-specific Fan class"""
 
+    # FanBase declares no __slots__, attributes it sets go to the inherited __dict__
+    __slots__ = ('index', 'position', 'is_psu_fan', 'attr_path', 'fan_name', 'speed_file',
+                 '_reading', '_reading_time', '_snapshot_window')
+
     def __init__(self, fan_index, position_index, attr_path, psu_fan = False):
         # fan_index: the index of a fan module belongs to
         # position_index : position of the fan in a fan module, 0 -> front, 1 -> rear,
@@ -29,29 +35,19 @@ class Fan(FanBase):
             self.speed_file = attr_path[1]
         else:
             self.fan_name = "FAN{}".format(self.index)
+        self._init_snapshot_reader()
         
-    def __read_attr_file(self, filepath, line=0xFF):
-        try:
-            with open(filepath,'r') as fd:
-                if line == 0xFF:
-                    data = fd.read()
-                    return data.rstrip('\r\n')
-                else:
-                    data = fd.readlines()
-                    return data[line].rstrip('\r\n')
-        except Exception as ex:
-            logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
-        
-        return None
-            
     def get_presence(self):
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.presence
         if self.is_psu_fan is True:
-            data = self.__read_attr_file(self.attr_path + 'psu{}_prnt'.format(self.index))
+            data = read_attr(self.attr_path + 'psu{}_prnt'.format(self.index))
             if data == '1':
                 return True
             else:
                 return False
-        ret = self.__read_attr_file(self.attr_path + 'fan{}_present'.format(self.index))
+        ret = read_attr(self.attr_path + 'fan{}_present'.format(self.index))
         if ret == '1':
             return True
         elif ret == '0':
@@ -59,6 +55,10 @@ class Fan(FanBase):
         else:
             return False
 
+    def _read_reading(self):
+        presence = self.get_presence()
+        return FanReading(self.fan_name, presence, self.get_status(), self._read_speed(presence))
+
     def get_name(self):
         """
         Retrieves the name of the device
@@ -77,13 +77,16 @@ class Fan(FanBase):
         return self.FAN_DIRECTION_NOT_APPLICABLE
 
     def get_status(self):
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.status
         if self.is_psu_fan is True:
-            data = self.__read_attr_file(self.attr_path + 'psu{}_good'.format(self.index))
+            data = read_attr(self.attr_path + 'psu{}_good'.format(self.index))
             if data == '1':
                 return True
             else:
                 return False
-        data = self.__read_attr_file(self.attr_path + 'fan{}_stat'.format(self.index))
+        data = read_attr(self.attr_path + 'fan{}_stat'.format(self.index))
         if data == '1':
             return True
         elif data == '0':
@@ -98,19 +101,26 @@ class Fan(FanBase):
             An integer, the percentage of full fan speed, in the range 0 (off)
                  to 100 (full speed)
         """
-        if self.is_psu_fan is True and self.get_presence():
-            speed = self.__read_attr_file( self.speed_file, 0)
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.speed
+        return self._read_speed(self.get_presence())
+
+    def _read_speed(self, presence):
+        # presence: presence of the fan read by the caller
+        if self.is_psu_fan is True and presence:
+            speed = read_attr(self.speed_file, 0)
             if speed is not None:
                 return (int(speed)*100)//16000
             else:
                 return 0
             
-        if self.get_presence():
+        if presence:
             if self.position ==0:
                 speed_file =self.attr_path + 'fan{}_rpm'.format(self.index)
             else:
                 speed_file =self.attr_path + 'fan{}_rpm'.format(self.index)
-            data = self.__read_attr_file(speed_file)
+            data = read_attr(speed_file)
             if data is not None:
                 for sdata in data.split(' '):
                     if sdata.isdigit():
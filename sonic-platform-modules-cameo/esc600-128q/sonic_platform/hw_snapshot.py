@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+#############################################################################
+#
+# Module contains the immutable snapshot of all thermal, fan and PSU readings
+# of the chassis, and the mixin serving their getters from it
+#
+#############################################################################
+
+try:
+    import time
+    from collections import namedtuple
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found")
+
+# time in seconds the getters of a device are served from its reading in the latest
+# snapshot, 0 to read the hardware on every call
+HW_SNAPSHOT_WINDOW = 1
+
+ThermalReading = namedtuple('ThermalReading', ['name', 'temperature', 'high_threshold', 'low_threshold',
+                                               'high_critical_threshold', 'low_critical_threshold'])
+FanReading = namedtuple('FanReading', ['name', 'presence', 'status', 'speed'])
+PsuReading = namedtuple('PsuReading', ['name', 'presence', 'powergood_status', 'voltage',
+                                       'current', 'power', 'temperature'])
+# timestamp: time in seconds since the epoch the sweep started
+# thermals, fans, psus: tuples of the readings in the order of the chassis lists,
+#   fans holds the fans of the chassis followed by the fans of the PSUs,
+#   a reading is None if the device failed to be read
+HardwareSnapshot = namedtuple('HardwareSnapshot', ['timestamp', 'thermals', 'fans', 'psus'])
+
+class SnapshotReader(object):
+    """
+    Mixin of Thermal, Fan and Psu, the class declares the slots
+    '_reading', '_reading_time', '_snapshot_window' and implements _read_reading()
+    """
+    __slots__ = ()
+
+    def _init_snapshot_reader(self):
+        self._reading = None
+        self._reading_time = 0
+        self._snapshot_window = HW_SNAPSHOT_WINDOW
+
+    def _get_fresh_reading(self):
+        # the reading of the latest snapshot while it's within the window, None otherwise
+        reading = self._reading
+        if reading is None or self._snapshot_window <= 0:
+            return None
+        age = time.time() - self._reading_time
+        if age < 0 or age > self._snapshot_window:
+            return None
+        return reading
+
+    def read_snapshot_reading(self, timestamp):
+        """
+        Reads all values of the device from the hardware and keeps them as its latest reading
+
+        Args:
+            timestamp: Time in seconds since the epoch of the snapshot the reading belongs to
+        Returns:
+            A namedtuple of the values
+        """
+        # the getters have to go to the hardware while the reading is taken
+        self._reading = None
+        reading = self._read_reading()
+        self._reading_time = timestamp
+        self._reading = reading
+        return reading
+
+    def set_snapshot_window(self, window):
+        """
+        Sets the time the getters are served from the latest snapshot reading
+
+        Args:
+            window: Time in seconds, 0 to read the hardware on every call
+        """
+        self._snapshot_window = window
+        self._reading = None
@@ -4,14 +4,41 @@ try:
     import os
     import copy
     import json
+    import tempfile
     from sonic_py_common.logger import Logger
+    from sonic_platform.sysfs_attr import read_attr_int, write_attr, set_attr_ttl_policies
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
 logger = Logger("paltDev")
 PLATFORM_INSTALL_INFO_FILE = "/etc/sonic/platform_install.json"
+# every path below resolved from PLATFORM_INSTALL_INFO_FILE, compiled once by update_install_table()
+# and recompiled when the version or the mtime of PLATFORM_INSTALL_INFO_FILE doesn't match,
+# the table holds path strings only, BMC presence and the attributes provided by the running
+# drivers are probed on every load
+PLATFORM_INSTALL_TABLE_FILE = "/var/cache/sonic/platform-install/platform_install_table.json"
+PLATFORM_INSTALL_TABLE_VERSION = 3
+BMC_PRESENT_FILE = '/sys/class/hwmon/hwmon2/device/ESC600_SYS/bmc_present'
+# proxy files of the thermals and PSUs behind the BMC
+BMC_THERMAL_PATH = '/sys/class/hwmon/hwmon2/device/ESC600_THERMAL/'
+BMC_PSU_PATH = '/sys/class/hwmon/hwmon2/device/ESC600_POWER/'
 PLATFORM_NAME = "esc600_128q"
 
+# ATTR_TTL_POLICY_LIST
+#   (name, regular expression searched in the sysfs path, time in seconds its value is cached)
+#   the first match applies, the attributes matching none (presence, status, PSU outputs,
+#   fan speed...) are read on every call
+#   threshold : temp{}_max/min/crit/lcrit of hwmon, i.e. the CPU core temp sensors (support_mask 0x8B),
+#               the sensors behind the BMC have support_mask 0x01 and never read their temp_th*_max...
+#               proxy files, the pattern would cover them too if their thresholds get enabled
+#   version : CPLD versions
+#   temperature : temp{}_input of hwmon, *_temp and psu_temp_{} proxy files of the BMC
+ATTR_TTL_POLICY_LIST = [
+    ('threshold', r'_(max|min|crit|lcrit)$', 300),
+    ('version', r'_ver$', 600),
+    ('temperature', r'(temp[0-9]+_input|_temp|_temp_[0-9]+)$', 0.5),
+]
+
 # THERMAL_SENSOR_LIST
 # index is used to indicate the default temp{}_* under sysfile_path 
 # support_mask:  1:support  0:not support
@@ -151,6 +178,22 @@ PLATFORM_CARD_LIST = ['PHY_CPLD_1', 'PHY_CPLD_2', 'PHY_CPLD_3', 'PHY_CPLD_4', 'P
 SFP_GROUP_LIST = ['SFP-G11', 'SFP-G12', 'SFP-G21', 'SFP-G22', 'SFP-G31', 'SFP-G32', 'SFP-G41', 'SFP-G42',
                   'SFP-G51', 'SFP-G52', 'SFP-G61', 'SFP-G62', 'SFP-G71', 'SFP-G72', 'SFP-G81', 'SFP-G82']
 PORT_NUM = 0
+# per line card aggregated presence attribute, bit N set means port N+1 of the card is present
+SFP_CARD_PRESENT_BITMAP_FILE = 'QSFP_present_bitmap'
+# per line card interrupt attribute, the driver calls sysfs_notify() on it when presence/interrupt changes
+SFP_CARD_INT_FILE = 'QSFP_int'
+# per line card bulk attributes, write "mask value" in hex to set low power mode / reset of
+# the ports selected by mask with one write of the CPLD register
+SFP_CARD_LOW_POWER_BULK_FILE = 'QSFP_low_power_bulk'
+SFP_CARD_RESET_BULK_FILE = 'QSFP_reset_bulk'
+# (key in the card info, attribute) of the optional per line card attributes, a key is None
+# if the running driver doesn't provide the attribute
+SFP_CARD_FILE_LIST = [
+    ('bitmap_file', SFP_CARD_PRESENT_BITMAP_FILE),
+    ('int_file', SFP_CARD_INT_FILE),
+    ('lp_bulk_file', SFP_CARD_LOW_POWER_BULK_FILE),
+    ('reset_bulk_file', SFP_CARD_RESET_BULK_FILE),
+]
 
 # SFP-eeprom paths /sys/bus/i2c/devices/XX-0050
 SFP_GROUP_INFO = {
@@ -176,94 +219,192 @@ CHASSIS_COMPONENTS = [
     ["System-CPLD", "Used for managing CPU board devices and power"]
 ]
 
+def _bmc_is_exist():
+    if os.path.exists(BMC_PRESENT_FILE):
+        if read_attr_int(BMC_PRESENT_FILE) == 1:
+            return True
+    return False
+
+def _get_i2c_adapter(switch_install_info, parent):
+    # the root I2C adapter a device sits behind, muxes share the bus of their parent
+    while parent in switch_install_info:
+        parent = switch_install_info[parent].get('parent')
+    return parent
+
+def compile_install_table():
+    """
+    Resolves BMC or direct mode and the paths of all thermals, PSUs, fans and SFPs
+    from PLATFORM_INSTALL_INFO_FILE
+    Returns:
+        A dict of the table
+    """
+    source_mtime = os.stat(PLATFORM_INSTALL_INFO_FILE).st_mtime
+    with open(PLATFORM_INSTALL_INFO_FILE) as fd:
+        install_info = json.load(fd)
+    sfp_install_info = install_info[2]
+    device_install_info = install_info[1]
+    switch_install_info = install_info[0]
+
+    # port_start: index (start from 0) of the first port of the card
+    # bitmap_file/int_file/lp_bulk_file/reset_bulk_file: path of the attribute, the driver may
+    #   not provide it, see _resolve_install_table()
+    # index: line card index (start from 0), used as module id of card level events
+    port_num = 0
+    sfp_card_info = []
+    sfp_ext_sysfile_list = []
+    for card_name in PLATFORM_CARD_LIST:
+        card = device_install_info[card_name]
+        if card['portnum'] == 0:
+            continue
+        card_file_dict = {}
+        for key, name in SFP_CARD_FILE_LIST:
+            card_file_dict[key] = card['hwmon_path']+'/device/'+name
+        card_info = {'name': card_name, 'index': PLATFORM_CARD_LIST.index(card_name),
+                     'hwmon_path': card['hwmon_path'],
+                     'port_start': port_num, 'port_num': card['portnum']}
+        card_info.update(card_file_dict)
+        sfp_card_info.append(card_info)
+        for i in range(1,card['portnum']+1):
+            port_num = port_num+1
+            present_file = card['hwmon_path']+'/device/'+'QSFP_present_{}'.format(i)
+            lp_file = card['hwmon_path']+'/device/'+'QSFP_low_power_{}'.format(i)
+            reset_file = card['hwmon_path']+'/device/'+'QSFP_reset_{}'.format(i)
+            sfp_ext_sysfile_list.append([present_file,lp_file,reset_file])
+
+    # update path info with install info, the paths of direct mode
+    # Item 1/2 not changed, append directly
+    thermal_sensor_list = copy.deepcopy(THERMAL_SENSOR_LIST)
+    thermal_info = [thermal_sensor_list[0], thermal_sensor_list[1]]
+    for sensor in thermal_sensor_list[2:]:
+        install_info = device_install_info.get(sensor['name'])
+        if install_info :
+            sensor['sysfile_path'] = install_info.get('hwmon_path')
+            thermal_info.append(sensor)
+
+    psu_info = copy.deepcopy(PSU_INFO)
+    for psu_name in PSU_LIST:
+        install_info = device_install_info.get(psu_name)
+        if install_info and install_info.get('hwmon_path') is not None:
+            psu_info[psu_name]['attr_path'] = install_info.get('hwmon_path')+ '/device/'
+
+    sfp_info = copy.deepcopy(SFP_GROUP_INFO)
+    for sfp_group_name in SFP_GROUP_LIST:
+        install_info = sfp_install_info.get(sfp_group_name)
+        if install_info:
+            sfp_info[sfp_group_name]['paths'] = install_info.get('paths')
+            sfp_info[sfp_group_name]['number'] = install_info.get('number')
+            sfp_info[sfp_group_name]['parent'] = install_info.get('parent')
+            sfp_info[sfp_group_name]['adapter'] = _get_i2c_adapter(switch_install_info, install_info.get('parent'))
+            # 400G line card
+            if sfp_info[sfp_group_name]['number'] == 4:
+                sfp_info[sfp_group_name]['type'] = 'QSFP-DD'
+
+    return {
+        'version': PLATFORM_INSTALL_TABLE_VERSION,
+        'source_mtime': source_mtime,
+        'device_install_info': device_install_info,
+        'sfp_install_info': sfp_install_info,
+        'thermal_info': thermal_info,
+        'psu_info': psu_info,
+        'fan_info': copy.deepcopy(FAN_INFO),
+        'sfp_info': sfp_info,
+        'sfp_card_info': sfp_card_info,
+        'sfp_ext_sysfile_list': sfp_ext_sysfile_list,
+        'port_num': port_num,
+    }
+
+def update_install_table():
+    """
+    Compiles the install table and writes it to PLATFORM_INSTALL_TABLE_FILE, run it
+    whenever PLATFORM_INSTALL_INFO_FILE is written
+    Returns:
+        A dict of the table
+    """
+    table = compile_install_table()
+    try:
+        table_dir = os.path.dirname(PLATFORM_INSTALL_TABLE_FILE)
+        if not os.path.isdir(table_dir):
+            os.makedirs(table_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=table_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as tmp_fd:
+                json.dump(table, tmp_fd)
+            os.rename(tmp_path, PLATFORM_INSTALL_TABLE_FILE)
+        except (IOError, OSError):
+            os.unlink(tmp_path)
+            raise
+    except (IOError, OSError) as ex:
+        logger.log_warning("Unable to write {} due to {}".format(PLATFORM_INSTALL_TABLE_FILE, repr(ex)))
+    return table
+
+def load_install_table():
+    """
+    Loads the install table, it's compiled again if it's missing or out of date
+    Returns:
+        A dict of the table
+    """
+    table = None
+    try:
+        with open(PLATFORM_INSTALL_TABLE_FILE) as fd:
+            table = json.load(fd)
+        if table.get('version') != PLATFORM_INSTALL_TABLE_VERSION or \
+           table.get('source_mtime') != os.stat(PLATFORM_INSTALL_INFO_FILE).st_mtime:
+            table = None
+    except (IOError, OSError, ValueError, AttributeError):
+        table = None
+    if table is None:
+        table = update_install_table()
+    else:
+        # json turns the integer keys of ext_sysfile_list into strings
+        for sensor in table['thermal_info']:
+            if sensor.get('ext_sysfile_list'):
+                sensor['ext_sysfile_list'] = dict((int(key), value) for key, value in sensor['ext_sysfile_list'].items())
+    return _resolve_install_table(table)
+
+def _resolve_install_table(table):
+    # what depends on the running drivers and the BMC isn't kept in the table file, a table
+    # compiled before phy_cpld640 was loaded/upgraded or while the BMC was absent stays valid
+    bmc_exist = _bmc_is_exist()
+    table['bmc_exist'] = bmc_exist
+    for card in table['sfp_card_info']:
+        for key, name in SFP_CARD_FILE_LIST:
+            if card[key] is not None and not os.path.exists(card[key]):
+                card[key] = None
+    if not bmc_exist:
+        table['thermal_info'] = [sensor for sensor in table['thermal_info'] if sensor['sysfile_path'] is not None]
+        return table
+
+    device_install_info = table['device_install_info']
+    for sensor in table['thermal_info'][2:]:
+        sensor['sysfile_path'] = BMC_THERMAL_PATH
+    for psu_name in PSU_LIST:
+        if device_install_info.get(psu_name):
+            table['psu_info'][psu_name]['attr_path'] = BMC_PSU_PATH
+    return table
+
 class PlatDev():
     def __init__(self):
-        self.plat_name = PLATFORM_NAME
-        self.psu_info = copy.deepcopy(PSU_INFO)
-        self.thermal_info = []
-        self.fan_info = copy.deepcopy(FAN_INFO)
-        self.sfp_info = copy.deepcopy(SFP_GROUP_INFO)
-        self.device_install_info = dict()
-        self.sfp_install_info = dict()
-        
-        # get install info
-        self.get_dev_install_info()
-        # update path info with install info
-        # Item 1/2 not changed, append directly
-        self.thermal_info.append(THERMAL_SENSOR_LIST[0])
-        self.thermal_info.append(THERMAL_SENSOR_LIST[1])
-
-        for i in range(2, len(THERMAL_SENSOR_LIST)):
-            install_info = self.device_install_info.get(THERMAL_SENSOR_LIST[i]['name'])
-            if install_info :
-                if self.bmc_is_exist():
-                    THERMAL_SENSOR_LIST[i]['sysfile_path'] = '/sys/class/hwmon/hwmon2/device/ESC600_THERMAL/'
-                else:
-                    if install_info.get('hwmon_path') is None:
-                        continue
-                    THERMAL_SENSOR_LIST[i]['sysfile_path'] = install_info.get('hwmon_path')
-                self.thermal_info.append(THERMAL_SENSOR_LIST[i])
-
-        for psu_name in PSU_LIST:
-            install_info = self.device_install_info.get(psu_name)
-            if install_info:
-                if self.bmc_is_exist():
-                    self.psu_info[psu_name]['attr_path']= '/sys/class/hwmon/hwmon2/device/ESC600_POWER/'
-                else:
-                    self.psu_info[psu_name]['attr_path'] = install_info.get('hwmon_path')+ '/device/'
-        
-        for sfp_group_name in SFP_GROUP_LIST:
-            install_info = self.sfp_install_info.get(sfp_group_name)
-            if install_info:
-                self.sfp_info[sfp_group_name]['paths'] = install_info.get('paths')
-                self.sfp_info[sfp_group_name]['number'] = install_info.get('number')
-                # 400G line card
-                if self.sfp_info[sfp_group_name]['number'] == 4:
-                    self.sfp_info[sfp_group_name]['type'] = 'QSFP-DD'
-        
-    def get_dev_install_info(self):
         global SFP_EXT_SYSFILE_LIST
-        global  PORT_NUM
-        PORT_NUM =0
-        with open(PLATFORM_INSTALL_INFO_FILE) as fd:
-            install_info = json.load(fd)
-            self.sfp_install_info = install_info[2]
-            self.device_install_info = install_info[1]
-            for card_name in PLATFORM_CARD_LIST:
-                card = install_info[1][card_name]
-                if card['portnum'] == 0:
-                    continue
-                for i in range(1,card['portnum']+1):
-                    PORT_NUM = PORT_NUM+1
-                    present_file = card['hwmon_path']+'/device/'+'QSFP_present_{}'.format(i)
-                    lp_file = card['hwmon_path']+'/device/'+'QSFP_low_power_{}'.format(i)
-                    reset_file = card['hwmon_path']+'/device/'+'QSFP_reset_{}'.format(i)
-                    SFP_EXT_SYSFILE_LIST.append([present_file,lp_file,reset_file])
-
-    def __read_attr_file(self, filepath, line=0xFF):
-        try:
-            with open(filepath,'r') as fd:
-                if line == 0xFF:
-                    data = fd.read()
-                    return data.rstrip('\r\n')
-                else:
-                    data = fd.readlines()
-                    return data[line].rstrip('\r\n')
-        except Exception as ex:
-            logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
-        
-        return None
+        global PORT_NUM
+        self.plat_name = PLATFORM_NAME
+        set_attr_ttl_policies(ATTR_TTL_POLICY_LIST)
+        table = load_install_table()
+        self.bmc_exist = table['bmc_exist']
+        self.device_install_info = table['device_install_info']
+        self.sfp_install_info = table['sfp_install_info']
+        self.thermal_info = table['thermal_info']
+        self.psu_info = table['psu_info']
+        self.fan_info = table['fan_info']
+        self.sfp_info = table['sfp_info']
+        self.sfp_card_info = table['sfp_card_info']
+        self.sfp_ext_sysfile_list = table['sfp_ext_sysfile_list']
+        self.port_num = table['port_num']
+        # kept for code reading the module globals, replaced rather than appended to
+        SFP_EXT_SYSFILE_LIST = self.sfp_ext_sysfile_list
+        PORT_NUM = self.port_num
 
     def bmc_is_exist(self):
-        bmc_filePath = '/sys/class/hwmon/hwmon2/device/ESC600_SYS/bmc_present'
-        if os.path.exists(bmc_filePath):
-            value = self.__read_attr_file(bmc_filePath)
-            if int(value) == 1:
-                return True
-            else:
-                return False
-        else:
-            return False
+        return self.bmc_exist
     ######Componet method #####
     def get_component_count(self):
         return len(CHASSIS_COMPONENTS)
@@ -333,7 +474,7 @@ class PlatDev():
     
     ###### SFP method ######
     def get_sfp_num(self):
-        return PORT_NUM
+        return self.port_num
     
     def get_sfp_group_list(self):
         return SFP_GROUP_LIST
@@ -352,9 +493,63 @@ class PlatDev():
     
     def get_sfp_group_number_by_name(self, name):
         return self.sfp_info[name].get('number')
+
+    def get_sfp_group_parent_by_name(self, name):
+        return self.sfp_info[name].get('parent')
+
+    def get_sfp_group_adapter_by_name(self, name):
+        return self.sfp_info[name].get('adapter')
     
     def get_sfp_ext_sysfile_list(self):
-        return SFP_EXT_SYSFILE_LIST
+        return self.sfp_ext_sysfile_list
+
+    def get_sfp_card_list(self):
+        return self.sfp_card_info
+
+    def get_sfp_card_presence_bitmap(self, card):
+        """
+        Retrieves the presence of all ports on a line card with one read
+        Args:
+            card: A dict from get_sfp_card_list()
+        Returns:
+            An integer, bit N set means port N+1 of the card is present,
+            None if the bitmap is not available
+        """
+        if card['bitmap_file'] is None:
+            return None
+
+        bitmap = read_attr_int(card['bitmap_file'], 16)
+        if bitmap is None:
+            return None
+        return bitmap & ((1 << card['port_num']) - 1)
+
+    def set_sfp_card_lpmode_bitmap(self, card, mask, value):
+        """
+        Sets the low power mode of several ports on a line card with one write
+        Args:
+            card: A dict from get_sfp_card_list()
+            mask: An integer, bit N set selects port N+1 of the card
+            value: An integer, bit N set to enable low power mode of port N+1
+        Returns:
+            A boolean, True if successful, False if not or the bulk attribute is not available
+        """
+        if card['lp_bulk_file'] is None:
+            return False
+        return write_attr(card['lp_bulk_file'], '0x{:x} 0x{:x}'.format(mask, value))
+
+    def set_sfp_card_reset_bitmap(self, card, mask, value):
+        """
+        Puts several ports on a line card into or out of reset with one write
+        Args:
+            card: A dict from get_sfp_card_list()
+            mask: An integer, bit N set selects port N+1 of the card
+            value: An integer, bit N set to hold port N+1 in reset, clear to release it
+        Returns:
+            A boolean, True if successful, False if not or the bulk attribute is not available
+        """
+        if card['reset_bulk_file'] is None:
+            return False
+        return write_attr(card['reset_bulk_file'], '0x{:x} 0x{:x}'.format(mask, value))
 
 
 
@@ -11,6 +11,8 @@ try:
     from sonic_platform_base.psu_base import PsuBase
     from sonic_py_common.logger import Logger
     from sonic_platform.fan import Fan
+    from sonic_platform.sysfs_attr import read_attr
+    from sonic_platform.hw_snapshot import SnapshotReader, PsuReading
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found")
 
@@ -22,9 +24,14 @@ PSU_MAX_VOUT = 12.0 # voltage
 PSU_MIN_VOUT = 3.3 # voltage
 PSU_MAX_TEMP = 50.0 # C
 
-class Psu(PsuBase):
+class Psu(PsuBase, SnapshotReader):
     """Platform-specific Psu class"""
 
+    # _fan_list/_thermal_list are set by PsuBase.__init__, PsuBase declares no __slots__
+    # so attributes a newer base adds go to the inherited __dict__
+    __slots__ = ('index', 'is_bmc', 'attr_path', 'status_path', 'psu_name',
+                 '_fan_list', '_thermal_list', '_reading', '_reading_time', '_snapshot_window')
+
     def __init__(self, index, info_list,is_bmc):
         PsuBase.__init__(self)
         self.index = index
@@ -39,20 +46,12 @@ class Psu(PsuBase):
         fan = Fan( index, 0, [self.status_path, speed_file ],True)
         self._fan_list.append(fan)
         self.psu_name = "PSU{}".format(self.index+1)
+        self._init_snapshot_reader()
 
-    def __read_attr_file(self, filepath, line=0xFF):
-        try:
-            with open(filepath,'r') as fd:
-                if line == 0xFF:
-                    data = fd.read()
-                    return data.rstrip('\r\n')
-                else:
-                    data = fd.readlines()
-                    return data[line].rstrip('\r\n')
-        except Exception as ex:
-            logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
-        
-        return None
+    def _read_reading(self):
+        return PsuReading(self.psu_name, self.get_presence(), self.get_powergood_status(),
+                          self.get_voltage(), self.get_current(), self.get_power(),
+                          self.get_temperature())
 
     def get_name(self):
         return self.psu_name
@@ -63,7 +62,10 @@ class Psu(PsuBase):
         Returns:
             bool: True if PSU is present, False if not
         """
-        data = self.__read_attr_file(self.status_path + 'psu{}_prnt'.format(self.index+1))
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.presence
+        data = read_attr(self.status_path + 'psu{}_prnt'.format(self.index+1))
         if data == '1':
             return True
         else:
@@ -76,7 +78,10 @@ class Psu(PsuBase):
             A boolean, True if PSU has stablized its output voltages and passed all
             its internal self-tests, False if not.
         """
-        data = self.__read_attr_file(self.status_path + 'psu{}_good'.format(self.index+1))
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.powergood_status
+        data = read_attr(self.status_path + 'psu{}_good'.format(self.index+1))
         if data == '1':
             return True
         else:
@@ -89,11 +94,14 @@ class Psu(PsuBase):
             A float number, the output voltage in volts, 
             e.g. 12.1 
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.voltage
         if self.is_bmc:
             path = self.attr_path + 'psu{}_vout'.format(self.index+1)
         else:
             path = self.attr_path + "/psu_vout"
-        vout = self.__read_attr_file( path, 0)
+        vout = read_attr(path, 0)
         if vout is not None:
             return float(vout) / 1000
         
@@ -105,11 +113,14 @@ class Psu(PsuBase):
         Returns:
             A float number, the electric current in amperes, e.g 15.4
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.current
         if self.is_bmc:
             path = self.attr_path + 'psu{}_iout'.format(self.index+1)
         else:
             path = self.attr_path + "/psu_iout"
-        iout = self.__read_attr_file( path, 0)
+        iout = read_attr(path, 0)
         if iout is not None:
             return float(iout) / 1000
         return False
@@ -120,11 +131,14 @@ class Psu(PsuBase):
         Returns:
             A float number, the power in watts, e.g. 302.6
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.power
         if self.is_bmc:
             path = self.attr_path + 'psu{}_pout'.format(self.index+1)
         else:
             path = self.attr_path + "/psu_pout"
-        pout = self.__read_attr_file( path, 0)
+        pout = read_attr(path, 0)
         if pout is not None:
             return float(pout) / 1000000
         return False
@@ -155,11 +169,14 @@ class Psu(PsuBase):
             A float number of current temperature in Celsius up to nearest thousandth
             of one degree Celsius, e.g. 30.125 
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.temperature
         if self.is_bmc:
             path = self.attr_path+'psu{}_temp'.format(self.index+1)
         else:
             path = self.attr_path + "/psu_temp_1"
-        temperature = self.__read_attr_file( path, 0)
+        temperature = read_attr(path, 0)
         if temperature is not None:
             return float(temperature) / 1000
         
@@ -8,9 +8,15 @@
 #############################################################################
 
 try:
+    import os
     import time
+    import json
+    import struct
+    import tempfile
+    import threading
     from sonic_platform_base.sfp_base import SfpBase
     from sonic_py_common.logger import Logger
+    from sonic_platform.sysfs_attr import read_attr_int, write_attr
     from sonic_platform_base.sonic_sfp.sff8472 import sff8472InterfaceId
     from sonic_platform_base.sonic_sfp.sff8472 import sff8472Dom
     from sonic_platform_base.sonic_sfp.sff8436 import sff8436InterfaceId
@@ -220,10 +226,21 @@ OFFSET = 0
 WIDTH = 1
 
 QSFP_UPPER_MEMORY_PAGE00_OFFSET = 128
+QSFP_UPPER_MEMORY_PAGE01_OFFSET = 256
 QSFP_UPPER_MEMORY_PAGE02_OFFSET = 384
 QSFP_UPPER_MEMORY_PAGE03_OFFSET = 512
 
 QSFP_DD_PAGE11_OFFSET = 512
+# page 11h lane monitors (tx power, tx bias, rx power of 8 lanes) are read as one block and
+# served to all DOM getters for at least QSFP_DD_LANE_SNAPSHOT_TTL seconds, every page 11h
+# access costs a page select plus the read
+QSFP_DD_LANE_SNAPSHOT_TTL = 1.0
+
+# page snapshot: lower page from the media type (85) + upper page 00h, optionally followed by
+# upper page 01h, the module flags (lower page 8-13) are latched and aren't read with it
+QSFP_DD_SNAPSHOT_OFFSET = 85
+QSFP_DD_SNAPSHOT_PAGE00_WIDTH = 256 - QSFP_DD_SNAPSHOT_OFFSET
+QSFP_DD_SNAPSHOT_PAGE01_WIDTH = 384 - QSFP_DD_SNAPSHOT_OFFSET
 
 SFP_A0H_OFFSET = 0
 SFP_A2H_OFFSET = 0
@@ -335,6 +352,74 @@ QSFP_DD_ID_FIELDS = {
     'TX_POWER': [26, 16]
 }
 
+# DOM_SNAPSHOT_REGION_DICT
+# DOM regions of each type read as one block, the fields inside are served from the block
+# while it's fresh, see Sfp.set_dom_snapshot_window()
+#   (path index, offset, width, window kept even when the snapshot window is off)
+DOM_SNAPSHOT_REGION_DICT = {
+    # lower page: temperature(22) .. channel monitors(34-57)
+    QSFP_TYPE: ((INDEX_A0H, 22, 36, 0),),
+    # A2h: temperature(96) .. rx power(104-105), through 0x51 or linear after A0h
+    SFP_TYPE: ((INDEX_A2H, 96, 10, 0), (INDEX_A0H, 256 + 96, 10, 0)),
+    # lower page: temperature(14) and voltage(16), page 11h: lane monitors of 8 lanes
+    QSFP_DD_TYPE: ((INDEX_A0H, 14, 4, 0),
+                   (INDEX_A0H, QSFP_DD_PAGE11_OFFSET + 26, 48, QSFP_DD_LANE_SNAPSHOT_TTL)),
+}
+# default snapshot window in seconds, 0: off
+DOM_SNAPSHOT_WINDOW = 0
+
+# status/control flags read by Sfp.get_status_flags()
+# the reads cover only the status bytes, the latched flags around them (QSFP byte 5-21, CMIS
+# lower page byte 8-13) are cleared by any read of them and are left to whoever reports them
+# QSFP lower page 2..4 and 86:
+#   byte 2 bit 0 data not ready, byte 3 bit 0-3 rx los (latched), byte 4 bit 0-3 tx fault (latched),
+#   byte 86 bit 0-3 tx disable
+QSFP_STATUS_FLAGS_OFFSET = 2
+QSFP_STATUS_FLAGS_WIDTH = 3
+QSFP_STATUS_BYTE = 0
+QSFP_LATCHED_FLAGS_BYTE = 1
+QSFP_TX_DISABLE_OFFSET = 86
+QSFP_TX_DISABLE_WIDTH = 1
+QSFP_LANE_NUM = 4
+# latched lane flags of QSFP byte 3..4
+QSFP_LATCHED_FLAG_NAMES = ('rx_los', 'tx_fault')
+# SFP A2h byte 110 status/control:
+#   bit 7 tx disable state, bit 6 soft tx disable, bit 2 tx fault, bit 1 rx los, bit 0 data not ready
+SFP_STATUS_CONTROL_OFFSET = 110
+SFP_STATUS_CONTROL_WIDTH = 1
+# QSFP-DD lower page byte 3 bit 3-1 module state (2: ModulePwrUp, the module is initializing),
+# page 11h byte 135..147 latched lane flags of lane 1-8, read as one block
+# page 10h (tx disable) is not mapped by the eeprom driver of this platform, tx disable is None
+QSFP_DD_MODULE_STATE_OFFSET = 3
+QSFP_DD_MODULE_STATE_WIDTH = 1
+QSFP_DD_MODULE_STATE_PWRUP = 2
+# CMIS module state, lower page byte 3 bit 3-1
+QSFP_DD_MODULE_STATE_DICT = {
+    1: 'ModuleLowPwr',
+    2: 'ModulePwrUp',
+    3: 'ModuleReady',
+    4: 'ModulePwrDn',
+    5: 'ModuleFault',
+}
+QSFP_DD_LANE_FLAGS_OFFSET = QSFP_DD_PAGE11_OFFSET + 7
+QSFP_DD_LANE_FLAGS_WIDTH = 13
+QSFP_DD_LANE_NUM = 8
+# latched lane flags of page 11h byte 135..147
+QSFP_DD_LATCHED_FLAG_NAMES = ('tx_fault', 'tx_los', 'tx_cdr_lol', 'tx_adaptive_eq_fail',
+                              'tx_power_high_alarm', 'tx_power_low_alarm',
+                              'tx_power_high_warning', 'tx_power_low_warning',
+                              'tx_bias_high_alarm', 'tx_bias_low_alarm',
+                              'tx_bias_high_warning', 'tx_bias_low_warning', 'rx_los')
+# latched flags reported by get_status_flags()
+LATCHED_STATUS_FLAG_KEYS = ('rx_los', 'tx_fault')
+
+# number of DOM lanes of each type, used by the DOM history
+SFP_LANE_NUM_DICT = {
+    SFP_TYPE: 1,
+    QSFP_TYPE: QSFP_LANE_NUM,
+    QSFP_DD_TYPE: QSFP_DD_LANE_NUM,
+}
+
 
 qsfp_cable_length_tup = ('Length(km)', 'Length OM3(2m)', 
                          'Length OM2(m)', 'Length OM1(m)',
@@ -355,8 +440,221 @@ qsfp_compliance_code_tup = ('10/40G Ethernet Compliance Code', 'SONET Compliance
                             'Fibre Channel link length/Transmitter Technology',
                             'Fibre Channel transmission media', 'Fibre Channel Speed')
 
+VENDOR_ID_FIELD_NAMES = ('VENDOR_NAME', 'VENDOR_OUI', 'VENDOR_PN',
+                         'VENDOR_REV', 'VENDOR_SN', 'VENDOR_DATE')
+
+# hex string of every byte value, shared by all reads instead of formatting each byte
+HEX_BYTE_TABLE = tuple('{:02x}'.format(n) for n in range(0, 256))
+
+def _compile_field_layout(id_fields, field_names):
+    # precompile a struct layout which unpacks the given (non-overlapping) fields in one call
+    field_names = sorted(field_names, key=lambda name: id_fields[name][OFFSET])
+    layout = '='
+    position = 0
+    for name in field_names:
+        layout += '{}x{}s'.format(id_fields[name][OFFSET] - position, id_fields[name][WIDTH])
+        position = id_fields[name][OFFSET] + id_fields[name][WIDTH]
+    return (tuple(field_names), struct.Struct(layout))
+
+QSFP_VENDOR_FIELD_LAYOUT = _compile_field_layout(QSFP_ID_FIELDS, VENDOR_ID_FIELD_NAMES)
+SFP_VENDOR_FIELD_LAYOUT = _compile_field_layout(SFP_ID_FIELDS, VENDOR_ID_FIELD_NAMES)
+QSFP_DD_VENDOR_FIELD_LAYOUT = _compile_field_layout(QSFP_DD_ID_FIELDS, VENDOR_ID_FIELD_NAMES)
+
+def _to_hex_list(raw_data):
+    return [HEX_BYTE_TABLE[b] for b in bytearray(raw_data)]
+
+def _bytes_to_str(raw_data):
+    if str is bytes:
+        return raw_data.strip()
+    return raw_data.decode('ascii', 'ignore').strip()
+
+def _decode_vendor_fields(field_layout, eeprom_raw, offset):
+    # decode vendor name/PN/rev/SN/OUI/date straight from the raw buffer, the output
+    # format is the same as the one of parse_vendor_*() in sff8436/sff8472/qsfp_dd
+    field_names, layout = field_layout
+    vendor_dict = dict(zip(field_names, layout.unpack_from(eeprom_raw, offset)))
+    for name in ('VENDOR_NAME', 'VENDOR_PN', 'VENDOR_REV', 'VENDOR_SN'):
+        vendor_dict[name] = _bytes_to_str(vendor_dict[name])
+    vendor_dict['VENDOR_OUI'] = '-'.join(_to_hex_list(vendor_dict['VENDOR_OUI']))
+    date = _bytes_to_str(vendor_dict['VENDOR_DATE'])
+    vendor_dict['VENDOR_DATE'] = "20" + date[0:2] + "-" + date[2:4] + "-" + date[4:6] + " " + date[6:8]
+    return vendor_dict
+
+# a sysfs path failing ATTR_FAIL_THRESHOLD times in a row is skipped for a backoff period,
+# which starts at ATTR_BACKOFF_MIN and doubles (up to ATTR_BACKOFF_MAX) on every failed retry
+ATTR_FAIL_THRESHOLD = 3
+ATTR_BACKOFF_MIN = 1
+ATTR_BACKOFF_MAX = 64
+
+class AttrCircuitBreaker(object):
+    """Per-path circuit breaker for sysfs attribute reads"""
+    def __init__(self, fail_threshold, backoff_min, backoff_max):
+        self.fail_threshold = fail_threshold
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        # path : [consecutive failures, backoff in seconds, time of next retry]
+        self._path_state = {}
+        # the chassis sweeps ports from several threads
+        self._lock = threading.Lock()
+
+    def allow(self, path):
+        with self._lock:
+            state = self._path_state.get(path)
+            if state is None or state[0] < self.fail_threshold:
+                return True
+            # open: let a single (half-open) retry through once the backoff expired
+            now = time.time()
+            if now < state[2]:
+                return False
+            state[2] = now + state[1]
+            return True
+
+    def record_success(self, path):
+        with self._lock:
+            state = self._path_state.pop(path, None)
+        if state is not None:
+            logger.log_info("{} is readable again".format(path))
+
+    def record_failure(self, path):
+        with self._lock:
+            state = self._path_state.setdefault(path, [0, self.backoff_min, 0])
+            state[0] += 1
+            if state[0] < self.fail_threshold:
+                return
+            if state[0] > self.fail_threshold:
+                state[1] = min(state[1] * 2, self.backoff_max)
+            state[2] = time.time() + state[1]
+            fail_count, backoff = state[0], state[1]
+        logger.log_warning("{} failed {} times, skip it for {} seconds".format(path, fail_count, backoff))
+
+attr_breaker = AttrCircuitBreaker(ATTR_FAIL_THRESHOLD, ATTR_BACKOFF_MIN, ATTR_BACKOFF_MAX)
+
+# decoded transceiver info and thresholds are kept on disk across pmon restarts, one entry
+# per module keyed by the bytes from its vendor SN to the page 00h checksum(s), so one small
+# read tells whether an entry belongs to the module in the cage
+# bump DECODE_CACHE_VERSION when the format of the decoded info changes
+DECODE_CACHE_DIR = '/var/cache/sonic/decode-xcvr'
+DECODE_CACHE_VERSION = 1
+DECODE_CACHE_MAX_ENTRIES = 1024
+# (offset, width, offset of vendor SN in the region) of the key region of each type
+#   QSFP: page 00h CC_BASE(191) .. CC_EXT(223)
+#   SFP: A0h CC_BASE(63) .. CC_EXT(95)
+#   QSFP-DD: page 00h vendor SN(166) .. page checksum(222)
+DECODE_CACHE_KEY_REGION_DICT = {
+    QSFP_TYPE: (QSFP_UPPER_MEMORY_PAGE00_OFFSET + 63, 33, 5),
+    SFP_TYPE: (SFP_A0H_OFFSET + 63, 33, 5),
+    QSFP_DD_TYPE: (QSFP_UPPER_MEMORY_PAGE00_OFFSET + 38, 57, 0),
+}
+VENDOR_SN_WIDTH = 16
+
+def _json_to_str(data):
+    # json gives unicode strings on python2, turn them back into str as decoded from the eeprom
+    if str is not bytes:
+        return data
+    if isinstance(data, dict):
+        return dict((_json_to_str(key), _json_to_str(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return [_json_to_str(value) for value in data]
+    if isinstance(data, type(u'')):
+        return data.encode('utf-8')
+    return data
+
+class DecodeCache(object):
+    """On-disk cache of decoded transceiver info, shared by all processes"""
+    def __init__(self, cache_dir, max_entries):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        # turned off on the first failed write, e.g. the process can't write the cache dir
+        self._writable = True
+
+    def _get_entry_path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def load(self, key):
+        # returns name : decoded info of the module, {} if there's no valid entry
+        try:
+            with open(self._get_entry_path(key), 'r') as fd:
+                entry = json.load(fd)
+        except (IOError, OSError):
+            return {}
+        except ValueError:
+            logger.log_warning("Drop corrupted decode cache entry {}".format(key))
+            self._remove_entry(self._get_entry_path(key))
+            return {}
+        if not isinstance(entry, dict) or entry.get('version') != DECODE_CACHE_VERSION:
+            return {}
+        return _json_to_str(entry.get('info', {}))
+
+    def store(self, key, name, info):
+        # an entry is written to a temporary file and renamed, readers never see a partial one
+        if not self._writable:
+            return
+        entry_info = self.load(key)
+        entry_info[name] = info
+        try:
+            try:
+                os.makedirs(self.cache_dir)
+            except OSError:
+                if not os.path.isdir(self.cache_dir):
+                    raise
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'w') as tmp_fd:
+                    json.dump({'version': DECODE_CACHE_VERSION, 'info': entry_info}, tmp_fd)
+                os.rename(tmp_path, self._get_entry_path(key))
+            except Exception:
+                self._remove_entry(tmp_path)
+                raise
+        except Exception as ex:
+            self._writable = False
+            logger.log_warning("Unable to write decode cache {} due to {}, stop writing it".format(self.cache_dir, repr(ex)))
+            return
+        self._prune()
+
+    def _remove_entry(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _prune(self):
+        # keep the most recently written max_entries entries
+        try:
+            path_list = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                         if name.endswith('.json')]
+            if len(path_list) <= self.max_entries:
+                return
+            path_list.sort(key=lambda path: os.stat(path).st_mtime)
+        except OSError:
+            return
+        for path in path_list[0 : len(path_list) - self.max_entries]:
+            self._remove_entry(path)
+
+decode_cache = DecodeCache(DECODE_CACHE_DIR, DECODE_CACHE_MAX_ENTRIES)
+
+def _pread(fd, num_bytes, offset):
+    # os.pread is python3 only, fall back to lseek + read on python2
+    if hasattr(os, 'pread'):
+        return os.pread(fd, num_bytes, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, num_bytes)
+
 class Sfp(SfpBase):
     """Platform-specific Sfp class"""
+
+    # one Sfp per port lives in every process holding a Chassis, keep its attributes out of the
+    # per-instance dict, SfpBase declares no __slots__ so the (empty) dict itself remains
+    __slots__ = ('index', 'eeprom_path_list', 'present_file', 'lp_file', 'reset_file',
+                 '_eeprom_fd_list', '_eeprom_read_errors',
+                 '_presence', '_presence_generation', '_static_info_cache', '_decode_cache_key',
+                 '_default_sfp_type', '_sfp_type', '_sfp_type_generation', '_dom_capability_generation',
+                 'dom_supported', 'dom_temp_supported', 'dom_volt_supported',
+                 'dom_rx_power_supported', 'dom_tx_power_supported',
+                 'dom_tx_bias_power_supported', 'dom_rx_tx_power_bias_supported',
+                 'dom_thresholds_supported', 'dom_tx_disable_supported', 'optional_capability',
+                 'qsfp_page3_available', 'second_application_list', 'calibration',
+                 '_dom_snapshot_window', '_dom_snapshot_dict', '_latched_flag_dict',
+                 '_dom_history')
     def __init__(self, index, eeprom_path_list, sfp_type, ext_sysfile_list=None):
         # index: port index, start from 0
         # eeprom_path_list : a list of path to eeprom sysfile
@@ -371,83 +669,262 @@ class Sfp(SfpBase):
         # ext_sysfile_list[1]: SFP  path
         self.index = index
         self.eeprom_path_list = eeprom_path_list
+        # eeprom fd for [0x50, 0x51], opened on first read and closed when module is removed
+        self._eeprom_fd_list = [None, None]
+        self._eeprom_read_errors = 0
+        # bumped on every presence transition, static eeprom data is cached per generation
+        self._presence = None
+        self._presence_generation = 0
+        self._static_info_cache = {}
+        # (presence generation, key of the module in decode_cache)
+        self._decode_cache_key = None
+        # latched lane flags read but not yet reported, see _read_status_flags()
+        self._latched_flag_dict = {}
+        # (DomHistory, port index) the DOM values are recorded into, see set_dom_history()
+        self._dom_history = None
         
         self.present_file = ext_sysfile_list[self.index-1][0]
         self.lp_file = ext_sysfile_list[self.index-1][1]
         self.reset_file = ext_sysfile_list[self.index-1][2]
-        # get actual type or use default type from input parameter
-        self._get_sfp_type(sfp_type)
-        self._dom_capability_detect()
+        # nothing is read from the module here, the actual type and the dom capability
+        # are detected on first use and again after every insertion
+        # sfp_type: default type from input parameter, used until the module is detected
+        self._default_sfp_type = sfp_type
+        self._sfp_type = sfp_type
+        self._sfp_type_generation = None
+        self._dom_capability_generation = None
+        self.dom_supported = False
+        self.dom_temp_supported = False
+        self.dom_volt_supported = False
+        self.dom_rx_power_supported = False
+        self.dom_tx_power_supported = False
+        self.dom_tx_bias_power_supported = False
+        self.dom_rx_tx_power_bias_supported = False
+        self.qsfp_page3_available = False
+        self.second_application_list = False
+        self.calibration = 0
+        # _dom_snapshot_dict: (path index, region offset) -> (presence generation, read time, raw region)
+        self._dom_snapshot_window = DOM_SNAPSHOT_WINDOW
+        self._dom_snapshot_dict = {}
+
+    @property
+    def sfp_type(self):
+        if self._presence is None:
+            self.get_presence()
+        if self._sfp_type_generation != self._presence_generation:
+            generation = self._presence_generation
+            if not self._presence:
+                self._sfp_type = self._default_sfp_type
+                self._sfp_type_generation = generation
+            else:
+                sfp_type = self._get_sfp_type(self._default_sfp_type)
+                if sfp_type is not None:
+                    self._sfp_type = sfp_type
+                    self._sfp_type_generation = generation
+                else:
+                    self._sfp_type = self._default_sfp_type
+        return self._sfp_type
 
     def _get_sfp_type(self, sfp_type):
+        # get actual type or use default type from input parameter, None if the type can't be read
         ty = self._read_eeprom_bytes(SFP_ID_FIELDS['TYPE'][OFFSET], SFP_ID_FIELDS['TYPE'][WIDTH], INDEX_A0H)
         if ty is not None:
             if ty[0] in SFP_TYPE_CODE_LIST:
-                self.sfp_type = SFP_TYPE 
+                return SFP_TYPE
             elif ty[0] in QSFP_TYPE_CODE_LIST:
-                self.sfp_type = QSFP_TYPE 
+                return QSFP_TYPE
             elif ty[0] in QSFP_DD_TYPE_CODE_LIST:
-                self.sfp_type = QSFP_DD_TYPE 
+                return QSFP_DD_TYPE
             else:
-                self.sfp_type = sfp_type
                 logger.log_warning("Unreganized sfp type of module {} . {} unsupported, treated as specified type {}".format(self.index, ty[0], sfp_type))
-        else:
-            self.sfp_type = sfp_type
+                return sfp_type
+        return None
         
 
-    def _read_eeprom_bytes(self, offset, num_bytes, path_idx = INDEX_A0H):
-        eeprom_raw = []
-        
-        eeprom = None
-        
-        for i in range(0, num_bytes):
-            eeprom_raw.append("0x00")
-        
+    def _get_eeprom_fd(self, path_idx):
+        fd = self._eeprom_fd_list[path_idx]
+        if fd is None:
+            fd = os.open(self.eeprom_path_list[path_idx], os.O_RDONLY)
+            self._eeprom_fd_list[path_idx] = fd
+        return fd
+
+    def _close_eeprom_fd(self, path_idx):
+        fd = self._eeprom_fd_list[path_idx]
+        if fd is not None:
+            self._eeprom_fd_list[path_idx] = None
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _close_eeprom_fds(self):
+        for path_idx in range(0, len(self._eeprom_fd_list)):
+            self._close_eeprom_fd(path_idx)
+
+    def _read_eeprom_raw(self, offset, num_bytes, path_idx = INDEX_A0H):
         try:
-            eeprom = open(self.eeprom_path_list[path_idx], mode="rb", buffering=0)
-            eeprom.seek(offset)
-            raw_data = eeprom.read(num_bytes)
-            for nb in range(0, len(raw_data)):
-                eeprom_raw[nb] = hex(ord(raw_data[nb]))[2:].zfill(2)
+            eeprom_raw = bytearray(_pread(self._get_eeprom_fd(path_idx), num_bytes, offset))
         except Exception as ex:
             logger.log_error("Fail to read eeprom {}".format(self.eeprom_path_list[path_idx]))
             logger.log_error("  {}".format(ex))
-            if eeprom is not None:
-                eeprom.close()
+            self._eeprom_read_errors += 1
+            # the fd may be stale (module swapped, driver reloaded), reopen it on next read
+            self._close_eeprom_fd(path_idx)
             return None
-            
+
+        if len(eeprom_raw) < num_bytes:
+            eeprom_raw.extend(bytearray(num_bytes - len(eeprom_raw)))
         return eeprom_raw
 
-    def __read_attr_file(self, filepath, line=0xFF):
-        try:
-            with open(filepath,'r') as fd:
-                if line == 0xFF:
-                    data = fd.read()
-                    return data.rstrip('\r\n')
-                else:
-                    data = fd.readlines()
-                    return data[line].rstrip('\r\n')
-        except Exception as ex:
-            logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
-            time.sleep(5)
-        
+    def _read_eeprom_bytes(self, offset, num_bytes, path_idx = INDEX_A0H):
+        eeprom_raw = self._read_eeprom_raw(offset, num_bytes, path_idx)
+        if eeprom_raw is None:
+            return None
+        return _to_hex_list(eeprom_raw)
+
+    def _get_snapshot_field(self, eeprom_snapshot, page_offset, field):
+        start = page_offset + field[OFFSET]
+        return _to_hex_list(eeprom_snapshot[start : start + field[WIDTH]])
+
+    def _get_dom_region(self, offset, num_bytes, path_idx):
+        for region in DOM_SNAPSHOT_REGION_DICT.get(self.sfp_type, ()):
+            if region[0] == path_idx and region[1] <= offset and offset + num_bytes <= region[1] + region[2]:
+                return region
         return None
-            
-    def __write_attr_file(self, filepath, data):
-        try:
-            with open(filepath,'w') as fd:
-                return fd.write(data)
-        except Exception as ex:
-            logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
-        return 0
+
+    def _read_dom_bytes(self, offset, num_bytes, path_idx = INDEX_A0H):
+        # a field inside a DOM region is sliced out of one read of the whole region while it's
+        # fresh, so the getters of one poll share a read and see values of the same moment
+        region = self._get_dom_region(offset, num_bytes, path_idx)
+        if region is None:
+            return self._read_eeprom_bytes(offset, num_bytes, path_idx)
+        window = max(self._dom_snapshot_window, region[3])
+        if window <= 0:
+            return self._read_eeprom_bytes(offset, num_bytes, path_idx)
+
+        now = time.time()
+        key = (path_idx, region[1])
+        snapshot = self._dom_snapshot_dict.get(key)
+        if snapshot is None or snapshot[0] != self._presence_generation or not 0 <= now - snapshot[1] < window:
+            region_raw = self._read_eeprom_raw(region[1], region[2], path_idx)
+            if region_raw is None:
+                self._dom_snapshot_dict.pop(key, None)
+                return None
+            snapshot = (self._presence_generation, now, region_raw)
+            self._dom_snapshot_dict[key] = snapshot
+
+        start = offset - region[1]
+        return _to_hex_list(snapshot[2][start : start + num_bytes])
+
+    def set_dom_history(self, history, port_num):
+        """
+        Sets the history every DOM read of get_transceiver_bulk_status() is recorded into
+
+        Args:
+            history: A dom_history.DomHistory, None to stop recording
+            port_num: index of the port in the history (start from 0)
+        """
+        if history is None:
+            self._dom_history = None
+        else:
+            self._dom_history = (history, port_num)
+
+    def set_dom_snapshot_window(self, window):
+        """
+        Sets the time one read of a DOM region serves the DOM getters of this SFP
+
+        Args:
+            window: Time in seconds, 0 to read every field from the module
+        """
+        self._dom_snapshot_window = window
+        self._dom_snapshot_dict = {}
+
+    def __read_attr_int(self, filepath):
+        # a failing path is skipped (returns None at once) while its breaker is open
+        if not attr_breaker.allow(filepath):
+            return None
+        value = read_attr_int(filepath)
+        if value is None:
+            attr_breaker.record_failure(filepath)
+        else:
+            attr_breaker.record_success(filepath)
+        return value
     
+    def _read_presence(self):
+        # True/False, None if the present file can't be read
+        if self.present_file is None:
+            return False
+        value = self.__read_attr_int(self.present_file)
+        if value is None:
+            return None
+        return value == 1
+
     def get_presence(self):
-        if self.present_file is not None:
-            data = self.__read_attr_file(self.present_file)
-            if data is not None:
-                if int(data) == 1:
-                    return True
-        return False
+        presence = self._read_presence()
+        if presence is None:
+            # unreadable, e.g. skipped by the open breaker: keep the last known state rather
+            # than reporting a removal, a card that is gone is marked absent by the chassis scan
+            return bool(self._presence)
+        self._update_presence(presence)
+        return presence
+
+    def _update_presence(self, presence):
+        if presence != self._presence:
+            self._presence = presence
+            self._presence_generation += 1
+            self._invalidate_static_info()
+            self._latched_flag_dict = {}
+        if not presence:
+            self._close_eeprom_fds()
+
+    def _invalidate_static_info(self):
+        self._static_info_cache = {}
+
+    def _get_static_info(self, key, read_func):
+        # serial ID and thresholds don't change while the module stays seated, so decode them
+        # once per presence generation and only pay a presence read afterwards
+        if not self.get_presence():
+            return read_func()
+
+        generation = self._presence_generation
+        cache = self._static_info_cache.get(key)
+        if cache is not None and cache[0] == generation:
+            return dict(cache[1])
+
+        # decoded by an earlier process, e.g. before a pmon restart
+        decode_key = self._get_decode_cache_key()
+        if decode_key is not None:
+            info = decode_cache.load(decode_key).get(key)
+            if isinstance(info, dict):
+                self._static_info_cache[key] = (generation, dict(info))
+                return info
+
+        read_errors = self._eeprom_read_errors
+        info = read_func()
+        if info is not None and read_errors == self._eeprom_read_errors:
+            self._static_info_cache[key] = (generation, dict(info))
+            if decode_key is not None:
+                decode_cache.store(decode_key, key, info)
+        return info
+
+    def _get_decode_cache_key(self):
+        # key of the module in decode_cache, None if it can't be read or the module has no serial number
+        generation = self._presence_generation
+        if self._decode_cache_key is not None and self._decode_cache_key[0] == generation:
+            return self._decode_cache_key[1]
+
+        region = DECODE_CACHE_KEY_REGION_DICT.get(self.sfp_type)
+        if region is None:
+            return None
+        key_raw = self._read_eeprom_raw(region[0], region[1], INDEX_A0H)
+        if key_raw is None:
+            return None
+        key = None
+        vendor_sn = key_raw[region[2] : region[2] + VENDOR_SN_WIDTH]
+        if len(set(vendor_sn)) > 1:
+            key = '{}-{}'.format(self.sfp_type, ''.join(_to_hex_list(key_raw)))
+        self._decode_cache_key = (generation, key)
+        return key
         
     def _convert_string_to_num(self, value_str):
         if "-inf" in value_str:
@@ -469,6 +946,18 @@ class Sfp(SfpBase):
         else:
             return 'N/A'
 
+    def _refresh_dom_capability(self):
+        # capability bytes only change with the module, so detect them once per insertion
+        self.get_presence()
+        if self._dom_capability_generation == self._presence_generation:
+            return
+
+        generation = self._presence_generation
+        read_errors = self._eeprom_read_errors
+        self._dom_capability_detect()
+        if read_errors == self._eeprom_read_errors:
+            self._dom_capability_generation = generation
+
     def _dom_capability_detect(self):
         if not self.get_presence():
             self.dom_supported = False
@@ -622,6 +1111,9 @@ class Sfp(SfpBase):
         vendor_oui                 |1*255VCHAR     |vendor OUI
         ========================================================================
          """
+        return self._get_static_info('transceiver_info', self._read_transceiver_info)
+
+    def _read_transceiver_info(self):
         transceiver_info_dict_keys = [
                 'type',                      'hardware_rev',
                 'serial',                 'manufacturer',
@@ -634,21 +1126,26 @@ class Sfp(SfpBase):
         
         transceiver_info_dict = dict.fromkeys(transceiver_info_dict_keys, 'N/A')
         
+        self._refresh_dom_capability()
+        
         if self.sfp_type == QSFP_TYPE:
             field_offset = QSFP_UPPER_MEMORY_PAGE00_OFFSET  # upper memory map: Page 00h
             Id_field = QSFP_ID_FIELDS
             info_bulk_width = QSFP_INTERFACE_BULK_WIDTH
+            vendor_field_layout = QSFP_VENDOR_FIELD_LAYOUT
             sfpi_obj = sff8436InterfaceId()
             
         elif self.sfp_type == QSFP_DD_TYPE:
             field_offset = QSFP_UPPER_MEMORY_PAGE00_OFFSET  # upper memory map: Page 00h
             Id_field = QSFP_DD_ID_FIELDS
+            vendor_field_layout = QSFP_DD_VENDOR_FIELD_LAYOUT
             sfpi_obj = qsfp_dd_InterfaceId()
         
         elif self.sfp_type == SFP_TYPE:
             field_offset = SFP_A0H_OFFSET    # lower memory map: A0h (SFP i2c 0x50)
             Id_field = SFP_ID_FIELDS
             info_bulk_width = SFP_INTERFACE_BULK_WIDTH
+            vendor_field_layout = SFP_VENDOR_FIELD_LAYOUT
             sfpi_obj = sff8472InterfaceId()
         else:
             logger.log_error("Unsupported sfp type")
@@ -660,48 +1157,23 @@ class Sfp(SfpBase):
         
         if self.sfp_type != QSFP_DD_TYPE:
             # read Base ID field
-            sfp_interface_bulk_raw = self._read_eeprom_bytes(field_offset, ID_FIELD_WIDTH, INDEX_A0H)
+            sfp_interface_bulk_raw = self._read_eeprom_raw(field_offset, ID_FIELD_WIDTH, INDEX_A0H)
             if sfp_interface_bulk_raw is None:
                 logger.log_error(" Fail to read BaseID field of module {}".format(self.index+1))
                 return None
             
-            start = 0
-            end = start + info_bulk_width
-            sfp_interface_bulk_data = sfpi_obj.parse_sfp_info_bulk(sfp_interface_bulk_raw[start : end], 0)
-            
-            start = Id_field['VENDOR_NAME'][OFFSET]
-            end = start + Id_field['VENDOR_NAME'][WIDTH]
-            sfp_vendor_name_data = sfpi_obj.parse_vendor_name(sfp_interface_bulk_raw[start : end], 0)
-
-            start = Id_field['VENDOR_PN'][OFFSET]
-            end = start + Id_field['VENDOR_PN'][WIDTH]
-            sfp_vendor_pn_data = sfpi_obj.parse_vendor_pn(sfp_interface_bulk_raw[start : end], 0)
-
-            start = Id_field['VENDOR_REV'][OFFSET]
-            end = start + Id_field['VENDOR_REV'][WIDTH]
-            sfp_vendor_rev_data = sfpi_obj.parse_vendor_rev(sfp_interface_bulk_raw[start : end], 0)
-
-            start = Id_field['VENDOR_SN'][OFFSET]
-            end = start + Id_field['VENDOR_SN'][WIDTH]
-            sfp_vendor_sn_data = sfpi_obj.parse_vendor_sn(sfp_interface_bulk_raw[start : end], 0)
-
-            start = Id_field['VENDOR_OUI'][OFFSET]
-            end = start + Id_field['VENDOR_OUI'][WIDTH]
-            sfp_vendor_oui_data = sfpi_obj.parse_vendor_oui(sfp_interface_bulk_raw[start : end], 0)
-
-            start = Id_field['VENDOR_DATE'][OFFSET]
-            end = start + Id_field['VENDOR_DATE'][WIDTH]
-            sfp_vendor_date_data = sfpi_obj.parse_vendor_date(sfp_interface_bulk_raw[start : end], 0)
+            sfp_interface_bulk_data = sfpi_obj.parse_sfp_info_bulk(_to_hex_list(sfp_interface_bulk_raw[0 : info_bulk_width]), 0)
+            sfp_vendor_data = _decode_vendor_fields(vendor_field_layout, sfp_interface_bulk_raw, 0)
             
             compliance_code_dict = {}
             
             transceiver_info_dict['type'] = sfp_interface_bulk_data['data']['type']['value']
-            transceiver_info_dict['manufacturer'] = sfp_vendor_name_data['data']['Vendor Name']['value']
-            transceiver_info_dict['model'] = sfp_vendor_pn_data['data']['Vendor PN']['value']
-            transceiver_info_dict['hardware_rev'] = sfp_vendor_rev_data['data']['Vendor Rev']['value']
-            transceiver_info_dict['serial'] = sfp_vendor_sn_data['data']['Vendor SN']['value']
-            transceiver_info_dict['vendor_oui'] = sfp_vendor_oui_data['data']['Vendor OUI']['value']
-            transceiver_info_dict['vendor_date'] = sfp_vendor_date_data['data']['VendorDataCode(YYYY-MM-DD Lot)']['value']
+            transceiver_info_dict['manufacturer'] = sfp_vendor_data['VENDOR_NAME']
+            transceiver_info_dict['model'] = sfp_vendor_data['VENDOR_PN']
+            transceiver_info_dict['hardware_rev'] = sfp_vendor_data['VENDOR_REV']
+            transceiver_info_dict['serial'] = sfp_vendor_data['VENDOR_SN']
+            transceiver_info_dict['vendor_oui'] = sfp_vendor_data['VENDOR_OUI']
+            transceiver_info_dict['vendor_date'] = sfp_vendor_data['VENDOR_DATE']
             transceiver_info_dict['connector'] = sfp_interface_bulk_data['data']['Connector']['value']
             transceiver_info_dict['encoding'] = sfp_interface_bulk_data['data']['EncodingCodes']['value']
             transceiver_info_dict['ext_identifier'] = sfp_interface_bulk_data['data']['Extended Identifier']['value']
@@ -732,105 +1204,58 @@ class Sfp(SfpBase):
     
         else:
         # QSFP-DD
-            sfp_type_raw = self._read_eeprom_bytes(Id_field['TYPE'][OFFSET], Id_field['TYPE'][WIDTH])
-            if sfp_type_raw is not None:
-                sfp_type_data = sfpi_obj.parse_sfp_type(sfp_type_raw, 0)
-                transceiver_info_dict['type'] = str(sfp_type_data['data']['type']['value'])
-            else:
-                return transceiver_info_dict
-                
-            sfp_vendor_name_raw = self._read_eeprom_bytes((field_offset + Id_field['VENDOR_NAME'][OFFSET]), Id_field['VENDOR_NAME'][WIDTH])
-            if sfp_vendor_name_raw is not None:
-                sfp_vendor_name_data = sfpi_obj.parse_vendor_name(sfp_vendor_name_raw, 0)
-                transceiver_info_dict['manufacturer'] = str(sfp_vendor_name_data['data']['Vendor Name']['value'])
+            # read the lower page from the media type and upper page 00h (and 01h) at once, then
+            # decode every field from it, the offsets in the snapshot are relative to its start
+            if self.second_application_list:
+                snapshot_width = QSFP_DD_SNAPSHOT_PAGE01_WIDTH
             else:
+                snapshot_width = QSFP_DD_SNAPSHOT_PAGE00_WIDTH
+            eeprom_snapshot = self._read_eeprom_raw(QSFP_DD_SNAPSHOT_OFFSET, snapshot_width, INDEX_A0H)
+            if eeprom_snapshot is None:
                 return transceiver_info_dict
-                
-            sfp_vendor_pn_raw = self._read_eeprom_bytes((field_offset + Id_field['VENDOR_PN'][OFFSET]), Id_field['VENDOR_PN'][WIDTH])
-            if sfp_vendor_pn_raw is not None:
-                sfp_vendor_pn_data = sfpi_obj.parse_vendor_pn(sfp_vendor_pn_raw, 0)
-                transceiver_info_dict['model'] = str(sfp_vendor_pn_data['data']['Vendor PN']['value'])
-            else:
-                return transceiver_info_dict
-                
-            sfp_vendor_rev_raw = self._read_eeprom_bytes((field_offset + Id_field['VENDOR_REV'][OFFSET]), Id_field['VENDOR_REV'][WIDTH])
-            if sfp_vendor_rev_raw is not None:
-                sfp_vendor_rev_data = sfpi_obj.parse_vendor_rev(sfp_vendor_rev_raw, 0)
-                transceiver_info_dict['hardware_rev'] = str(sfp_vendor_rev_data['data']['Vendor Rev']['value'])
-            else:
-                return transceiver_info_dict
-                
-            sfp_vendor_sn_raw = self._read_eeprom_bytes((field_offset + Id_field['VENDOR_SN'][OFFSET]), Id_field['VENDOR_SN'][WIDTH])
-            if sfp_vendor_sn_raw is not None:
-                sfp_vendor_sn_data = sfpi_obj.parse_vendor_sn(sfp_vendor_sn_raw, 0)
-                transceiver_info_dict['serial'] = str(sfp_vendor_sn_data['data']['Vendor SN']['value'])
-            else:
-                return transceiver_info_dict
-            
-            sfp_vendor_oui_raw = self._read_eeprom_bytes((field_offset + Id_field['VENDOR_OUI'][OFFSET]), Id_field['VENDOR_OUI'][WIDTH])
-            if sfp_vendor_oui_raw is not None:
-                sfp_vendor_oui_data = sfpi_obj.parse_vendor_oui(sfp_vendor_oui_raw, 0)
-                transceiver_info_dict['vendor_oui'] = str(sfp_vendor_oui_data['data']['Vendor OUI']['value'])
-            else:
-                return transceiver_info_dict
-            
-            sfp_vendor_date_raw = self._read_eeprom_bytes((field_offset + Id_field['VENDOR_DATE'][OFFSET]), Id_field['VENDOR_DATE'][WIDTH])
-            if sfp_vendor_date_raw is not None:
-                sfp_vendor_date_data = sfpi_obj.parse_vendor_date(sfp_vendor_date_raw, 0)
-                transceiver_info_dict['vendor_date'] = str(sfp_vendor_date_data['data']['VendorDataCode(YYYY-MM-DD Lot)']['value'])
-            else:
-                return transceiver_info_dict
-            
-            sfp_connector_raw = self._read_eeprom_bytes((field_offset + Id_field['CONNECTOR'][OFFSET]), Id_field['CONNECTOR'][WIDTH])
-            if sfp_connector_raw is not None:
-                sfp_connector_data = sfpi_obj.parse_connector(sfp_connector_raw, 0)
-                transceiver_info_dict['connector'] = str(sfp_connector_data['data']['Connector']['value'])
-            else:
-                return transceiver_info_dict
-                
-            sfp_ext_identifier_raw = self._read_eeprom_bytes((field_offset + Id_field['EXTID'][OFFSET]), Id_field['EXTID'][WIDTH])
-            if sfp_ext_identifier_raw is not None:
-                sfp_ext_identifier_data = sfpi_obj.parse_ext_iden(sfp_ext_identifier_raw, 0)
-                transceiver_info_dict['ext_identifier'] = str(sfp_ext_identifier_data['data']['Extended Identifier']['value'])
-            else:
-                return transceiver_info_dict
-                
-            sfp_cable_len_raw = self._read_eeprom_bytes((field_offset + Id_field['CABLE_LEN'][OFFSET]), Id_field['CABLE_LEN'][WIDTH])
-            if sfp_cable_len_raw is not None:
-                sfp_cable_len_data = sfpi_obj.parse_cable_len(sfp_cable_len_raw, 0)
-                transceiver_info_dict['cable_length'] = str(sfp_cable_len_data['data']['Length Cable Assembly(m)']['value'])
-            else:
-                return transceiver_info_dict
-            
-            sfp_media_type_raw = self._read_eeprom_bytes(Id_field['MEDIA_TYPE'][OFFSET], Id_field['MEDIA_TYPE'][WIDTH])
-            if sfp_media_type_raw is not None:
-                sfp_media_type_dict = sfpi_obj.parse_media_type(sfp_media_type_raw, 0)
-                if sfp_media_type_dict is None:
-                    return transceiver_info_dict
-        
-                host_media_list = ""
-                sfp_application_type_first_list = self._read_eeprom_bytes(Id_field['FIRST_APPL_LIST'][OFFSET], Id_field['FIRST_APPL_LIST'][WIDTH])
-                if self.second_application_list:
-                    possible_application_count = 15
-                    sfp_application_type_second_list = self._read_eeprom_bytes((256 + Id_field['SECOND_APPL_LIST'][OFFSET]), Id_field['SECOND_APPL_LIST'][WIDTH])
-                    if sfp_application_type_first_list is not None and sfp_application_type_second_list is not None:
-                        sfp_application_type_list = sfp_application_type_first_list + sfp_application_type_second_list
-                    else:
-                        return transceiver_info_dict
-                else:
-                    possible_application_count = 8
-                    if sfp_application_type_first_list is not None:
-                        sfp_application_type_list = sfp_application_type_first_list
-                    else:
-                        return transceiver_info_dict
-                        
-                for i in range(0, possible_application_count):
-                    if sfp_application_type_list[i * 4] == 'ff':
-                        break
-                    host_electrical, media_interface = sfpi_obj.parse_application(sfp_media_type_dict, sfp_application_type_list[i * 4], sfp_application_type_list[i * 4 + 1])
-                    host_media_list = host_media_list + host_electrical + ' - ' + media_interface + '\n\t\t\t\t   '
+            lower_offset = -QSFP_DD_SNAPSHOT_OFFSET
+            field_offset -= QSFP_DD_SNAPSHOT_OFFSET
+
+            sfp_type_data = sfpi_obj.parse_sfp_type(self._get_snapshot_field(eeprom_snapshot, field_offset, Id_field['TYPE']), 0)
+            transceiver_info_dict['type'] = str(sfp_type_data['data']['type']['value'])
+
+            sfp_vendor_data = _decode_vendor_fields(vendor_field_layout, eeprom_snapshot, field_offset)
+            transceiver_info_dict['manufacturer'] = sfp_vendor_data['VENDOR_NAME']
+            transceiver_info_dict['model'] = sfp_vendor_data['VENDOR_PN']
+            transceiver_info_dict['hardware_rev'] = sfp_vendor_data['VENDOR_REV']
+            transceiver_info_dict['serial'] = sfp_vendor_data['VENDOR_SN']
+            transceiver_info_dict['vendor_oui'] = sfp_vendor_data['VENDOR_OUI']
+            transceiver_info_dict['vendor_date'] = sfp_vendor_data['VENDOR_DATE']
+
+            sfp_connector_data = sfpi_obj.parse_connector(self._get_snapshot_field(eeprom_snapshot, field_offset, Id_field['CONNECTOR']), 0)
+            transceiver_info_dict['connector'] = str(sfp_connector_data['data']['Connector']['value'])
+
+            sfp_ext_identifier_data = sfpi_obj.parse_ext_iden(self._get_snapshot_field(eeprom_snapshot, field_offset, Id_field['EXTID']), 0)
+            transceiver_info_dict['ext_identifier'] = str(sfp_ext_identifier_data['data']['Extended Identifier']['value'])
+
+            sfp_cable_len_data = sfpi_obj.parse_cable_len(self._get_snapshot_field(eeprom_snapshot, field_offset, Id_field['CABLE_LEN']), 0)
+            transceiver_info_dict['cable_length'] = str(sfp_cable_len_data['data']['Length Cable Assembly(m)']['value'])
+
+            sfp_media_type_dict = sfpi_obj.parse_media_type(self._get_snapshot_field(eeprom_snapshot, lower_offset, Id_field['MEDIA_TYPE']), 0)
+            if sfp_media_type_dict is None:
+                # the info would lack the application advertisement, return None rather than
+                # a partial dict so it isn't cached for the presence generation
+                logger.log_error("Fail to decode media type of module {}".format(self.index))
+                return None
+
+            host_media_list = ""
+            sfp_application_type_list = self._get_snapshot_field(eeprom_snapshot, lower_offset, Id_field['FIRST_APPL_LIST'])
+            if self.second_application_list:
+                possible_application_count = 15
+                sfp_application_type_list = sfp_application_type_list + self._get_snapshot_field(eeprom_snapshot, QSFP_UPPER_MEMORY_PAGE01_OFFSET + lower_offset, Id_field['SECOND_APPL_LIST'])
             else:
-                return transceiver_info_dict
+                possible_application_count = 8
+
+            for i in range(0, possible_application_count):
+                if sfp_application_type_list[i * 4] == 'ff':
+                    break
+                host_electrical, media_interface = sfpi_obj.parse_application(sfp_media_type_dict, sfp_application_type_list[i * 4], sfp_application_type_list[i * 4 + 1])
+                host_media_list = host_media_list + host_electrical + ' - ' + media_interface + '\n\t\t\t\t   '
             
             transceiver_info_dict['encoding'] = "Not supported for CMIS cables"
             transceiver_info_dict['ext_rateselect_compliance'] = "Not supported for CMIS cables"
@@ -868,6 +1293,14 @@ class Sfp(SfpBase):
                                    |               |for example, tx2power stands for tx power of channel 2.
         ========================================================================
         """
+        dom_info = self._read_transceiver_bulk_status()
+        # xcvrd and get_transceiver_bulk_status_all() both come here, so every read is recorded once
+        if self._dom_history is not None and dom_info is not None and self._presence:
+            history, port_num = self._dom_history
+            history.record(port_num, dom_info, SFP_LANE_NUM_DICT.get(self.sfp_type, 1))
+        return dom_info
+
+    def _read_transceiver_bulk_status(self):
         transceiver_dom_info_dict_keys = [
                 'temperature',  'voltage',
                 'rx1power',     'rx2power',
@@ -885,7 +1318,7 @@ class Sfp(SfpBase):
 
         transceiver_dom_info_dict = dict.fromkeys(transceiver_dom_info_dict_keys, 'N/A')
         
-        self._dom_capability_detect()
+        self._refresh_dom_capability()
         
         path_idx = INDEX_A0H
         
@@ -920,20 +1353,20 @@ class Sfp(SfpBase):
             sfpd_obj._calibration_type = self.calibration
 
         if self.dom_temp_supported:
-            dom_temperature_raw = self._read_eeprom_bytes(field_offset + Id_field['TEMPERATURE'][OFFSET], Id_field['TEMPERATURE'][WIDTH], path_idx)
+            dom_temperature_raw = self._read_dom_bytes(field_offset + Id_field['TEMPERATURE'][OFFSET], Id_field['TEMPERATURE'][WIDTH], path_idx)
             if dom_temperature_raw is not None:
                 dom_temperature_data = sfpd_obj.parse_temperature(dom_temperature_raw, 0)
                 transceiver_dom_info_dict['temperature'] = self._convert_string_to_num(dom_temperature_data['data']['Temperature']['value'])
         
         if self.dom_volt_supported:
-            dom_voltage_raw = self._read_eeprom_bytes(field_offset + Id_field['VOLTAGE'][OFFSET], Id_field['VOLTAGE'][WIDTH], path_idx)
+            dom_voltage_raw = self._read_dom_bytes(field_offset + Id_field['VOLTAGE'][OFFSET], Id_field['VOLTAGE'][WIDTH], path_idx)
             if dom_voltage_raw is not None:
                 dom_voltage_data = sfpd_obj.parse_voltage(dom_voltage_raw, 0)
                 transceiver_dom_info_dict['voltage'] = self._convert_string_to_num(dom_voltage_data['data']['Vcc']['value'])
 
 
         if self.sfp_type == QSFP_TYPE:
-            dom_channel_monitor_raw = self._read_eeprom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+            dom_channel_monitor_raw = self._read_dom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
             if dom_channel_monitor_raw is not None:
                 dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params_with_tx_power(dom_channel_monitor_raw, 0)
             if self.dom_tx_power_supported:
@@ -954,7 +1387,7 @@ class Sfp(SfpBase):
         
         elif self.sfp_type == QSFP_DD_TYPE:
             if self.dom_rx_tx_power_bias_supported:
-                dom_channel_monitor_raw = self._read_eeprom_bytes(QSFP_DD_PAGE11_OFFSET + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+                dom_channel_monitor_raw = self._read_dom_bytes(QSFP_DD_PAGE11_OFFSET + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH])
                 if dom_channel_monitor_raw is None:
                     return transceiver_dom_info_dict
                 dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params(dom_channel_monitor_raw, 0)
@@ -989,7 +1422,7 @@ class Sfp(SfpBase):
                     transceiver_dom_info_dict['tx8bias'] = str(self._convert_string_to_num(dom_channel_monitor_data['data']['TX8Bias']['value']))
             
         elif self.sfp_type == SFP_TYPE:
-            dom_channel_monitor_raw = self._read_eeprom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+            dom_channel_monitor_raw = self._read_dom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
             if dom_channel_monitor_raw is not None:
                 dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params(dom_channel_monitor_raw, 0)
             transceiver_dom_info_dict['rx1power'] = self._convert_string_to_num(dom_channel_monitor_data['data']['RXPower']['value'])
@@ -1031,6 +1464,9 @@ class Sfp(SfpBase):
         txbiaslowwarning           |FLOAT          |Low Warning Threshold value of tx Bias Current in mA.
         ========================================================================
         """
+        return self._get_static_info('threshold_info', self._read_transceiver_threshold_info)
+
+    def _read_transceiver_threshold_info(self):
         dom_info_dict_keys = ['temphighalarm',    'temphighwarning',
                               'templowalarm',     'templowwarning',
                               'vcchighalarm',     'vcchighwarning',
@@ -1047,7 +1483,7 @@ class Sfp(SfpBase):
 
         path_idx = INDEX_A0H
 
-        self._dom_capability_detect()
+        self._refresh_dom_capability()
         if not self.dom_supported:
             return transceiver_dom_threshold_info_dict
 
@@ -1148,6 +1584,131 @@ class Sfp(SfpBase):
         
         return transceiver_dom_threshold_info_dict
 
+    def _get_lane_flag_list(self, flag_byte, lane_num):
+        return [(flag_byte >> lane) & 0x1 == 1 for lane in range(0, lane_num)]
+
+    def _merge_latched_flags(self, name_list, flags_raw, lane_num):
+        # ORs the latched flags just read into the ones read earlier and not reported yet
+        for name, flag_byte in zip(name_list, flags_raw):
+            flag_list = self._get_lane_flag_list(flag_byte, lane_num)
+            pending = self._latched_flag_dict.get(name)
+            if pending is not None and len(pending) == lane_num:
+                flag_list = [flag or pending_flag for flag, pending_flag in zip(flag_list, pending)]
+            self._latched_flag_dict[name] = flag_list
+
+    def _read_status_flags(self):
+        # the read clears the latched lane flags of QSFP and QSFP-DD, they are kept in
+        # _latched_flag_dict and ORed into every later read until _take_status_flags()
+        # or get_latched_flags() hands them out, so no getter loses a latch to another one
+        if not self.get_presence():
+            return None
+
+        status_flags_dict = {}
+        if self.sfp_type == QSFP_TYPE:
+            status_raw = self._read_eeprom_raw(QSFP_STATUS_FLAGS_OFFSET, QSFP_STATUS_FLAGS_WIDTH, INDEX_A0H)
+            tx_disable_raw = self._read_eeprom_raw(QSFP_TX_DISABLE_OFFSET, QSFP_TX_DISABLE_WIDTH, INDEX_A0H)
+            if status_raw is None or tx_disable_raw is None:
+                return None
+            self._merge_latched_flags(QSFP_LATCHED_FLAG_NAMES, status_raw[QSFP_LATCHED_FLAGS_BYTE:], QSFP_LANE_NUM)
+            status_flags_dict['reset_status'] = (status_raw[QSFP_STATUS_BYTE] & 0x1 != 0)
+            status_flags_dict['tx_disable_channel'] = tx_disable_raw[0] & 0xf
+            status_flags_dict['tx_disable'] = (status_flags_dict['tx_disable_channel'] != 0)
+
+        elif self.sfp_type == QSFP_DD_TYPE:
+            module_state_raw = self._read_eeprom_raw(QSFP_DD_MODULE_STATE_OFFSET, QSFP_DD_MODULE_STATE_WIDTH, INDEX_A0H)
+            lane_flags_raw = self._read_eeprom_raw(QSFP_DD_LANE_FLAGS_OFFSET, QSFP_DD_LANE_FLAGS_WIDTH, INDEX_A0H)
+            if module_state_raw is None or lane_flags_raw is None:
+                return None
+            self._merge_latched_flags(QSFP_DD_LATCHED_FLAG_NAMES, lane_flags_raw, QSFP_DD_LANE_NUM)
+            status_flags_dict['reset_status'] = ((module_state_raw[0] >> 1) & 0x7 == QSFP_DD_MODULE_STATE_PWRUP)
+            status_flags_dict['tx_disable_channel'] = None
+            status_flags_dict['tx_disable'] = None
+
+        elif self.sfp_type == SFP_TYPE:
+            if self.eeprom_path_list[INDEX_A2H] != 'n/a':
+                status_raw = self._read_eeprom_raw(SFP_STATUS_CONTROL_OFFSET, SFP_STATUS_CONTROL_WIDTH, INDEX_A2H)
+            else:
+                status_raw = self._read_eeprom_raw(256 + SFP_STATUS_CONTROL_OFFSET, SFP_STATUS_CONTROL_WIDTH, INDEX_A0H)
+            if status_raw is None:
+                return None
+            status_flags_dict['reset_status'] = (status_raw[0] & 0x1 != 0)
+            status_flags_dict['rx_los'] = [status_raw[0] & 0x2 != 0]
+            status_flags_dict['tx_fault'] = [status_raw[0] & 0x4 != 0]
+            status_flags_dict['tx_disable'] = (status_raw[0] & 0xc0 != 0)
+            status_flags_dict['tx_disable_channel'] = 0x1 if status_flags_dict['tx_disable'] else 0x0
+            return status_flags_dict
+
+        else:
+            return None
+
+        for key in LATCHED_STATUS_FLAG_KEYS:
+            status_flags_dict[key] = list(self._latched_flag_dict[key])
+        return status_flags_dict
+
+    def _take_status_flags(self, key_list):
+        # reads the status flags and drops the latched flags in key_list, they're reported now
+        status_flags_dict = self._read_status_flags()
+        if status_flags_dict is None:
+            return None
+        for key in key_list:
+            self._latched_flag_dict.pop(key, None)
+        return status_flags_dict
+
+    def get_status_flags(self):
+        """
+        Retrieves reset status, rx los, tx fault and tx disable of this SFP from one
+        read of its status/control bytes, the latched rx los and tx fault include the
+        ones raised since the last call of get_status_flags, get_rx_los or get_tx_fault
+
+        Returns:
+            A dict which contains following keys/values, None if not available :
+        ========================================================================
+        keys                       |Value Format   |Information
+        ---------------------------|---------------|----------------------------
+        reset_status               |BOOLEAN        |module is initializing
+        rx_los                     |LIST of BOOLEAN|rx los of each lane
+        tx_fault                   |LIST of BOOLEAN|tx fault of each lane
+        tx_disable                 |BOOLEAN        |tx disabled on any lane, None on QSFP-DD
+        tx_disable_channel         |INT            |tx disabled lanes, bit N for lane N, None on QSFP-DD
+        ========================================================================
+        """
+        return self._take_status_flags(LATCHED_STATUS_FLAG_KEYS)
+
+    def get_latched_flags(self):
+        """
+        Retrieves all latched lane flags of this QSFP or QSFP-DD raised since the last call,
+        the read of the status flags clears them in the module so they are kept until they're
+        reported here, rx los and tx fault are also reported by get_status_flags, get_rx_los
+        and get_tx_fault
+
+        Returns:
+            A dict, flag name : LIST of BOOLEAN of each lane, {} for SFP, None if not available
+            QSFP: rx_los, tx_fault of byte 3..4
+            QSFP-DD: tx_fault, tx_los, tx_cdr_lol, tx_adaptive_eq_fail, tx power and tx bias
+                     alarms/warnings and rx_los of page 11h byte 135..147
+        """
+        if self._read_status_flags() is None:
+            return None
+        latched_flag_dict = self._latched_flag_dict
+        self._latched_flag_dict = {}
+        return latched_flag_dict
+
+    def get_module_state(self):
+        """
+        Retrieves the CMIS module state of this QSFP-DD
+
+        Returns:
+            A string, one of 'ModuleLowPwr', 'ModulePwrUp', 'ModuleReady', 'ModulePwrDn',
+            'ModuleFault' or 'Unknown', None if not QSFP-DD or not available
+        """
+        if not self.get_presence() or self.sfp_type != QSFP_DD_TYPE:
+            return None
+
+        module_state_raw = self._read_eeprom_raw(QSFP_DD_MODULE_STATE_OFFSET, QSFP_DD_MODULE_STATE_WIDTH, INDEX_A0H)
+        if module_state_raw is None:
+            return None
+        return QSFP_DD_MODULE_STATE_DICT.get((module_state_raw[0] >> 1) & 0x7, 'Unknown')
+
     def get_reset_status(self):
         """
         Retrieves the reset status of SFP
@@ -1155,7 +1716,10 @@ class Sfp(SfpBase):
         Returns:
             A Boolean, True if reset enabled, False if disabled
         """
-        raise NotImplementedError
+        status_flags_dict = self._take_status_flags(())
+        if status_flags_dict is None:
+            return None
+        return status_flags_dict['reset_status']
 
     def get_rx_los(self):
         """
@@ -1165,7 +1729,10 @@ class Sfp(SfpBase):
             A Boolean, True if SFP has RX LOS, False if not.
             Note : RX LOS status is latched until a call to get_rx_los or a reset.
         """
-        raise NotImplementedError
+        status_flags_dict = self._take_status_flags(('rx_los',))
+        if status_flags_dict is None:
+            return None
+        return True in status_flags_dict['rx_los']
 
     def get_tx_fault(self):
         """
@@ -1175,16 +1742,23 @@ class Sfp(SfpBase):
             A Boolean, True if SFP has TX fault, False if not
             Note : TX fault status is lached until a call to get_tx_fault or a reset.
         """
-        raise NotImplementedError
+        status_flags_dict = self._take_status_flags(('tx_fault',))
+        if status_flags_dict is None:
+            return None
+        return True in status_flags_dict['tx_fault']
 
     def get_tx_disable(self):
         """
         Retrieves the tx_disable status of this SFP
 
         Returns:
-            A Boolean, True if tx_disable is enabled, False if disabled
+            A Boolean, True if tx_disable is enabled, False if disabled,
+            None if not available (QSFP-DD)
         """
-        raise NotImplementedError
+        status_flags_dict = self._take_status_flags(())
+        if status_flags_dict is None:
+            return None
+        return status_flags_dict['tx_disable']
 
     def get_tx_disable_channel(self):
         """
@@ -1195,8 +1769,12 @@ class Sfp(SfpBase):
             TX channels which have been disabled in this SFP.
             As an example, a returned value of 0x5 indicates that channel 0 
             and channel 2 have been disabled.
+            None if not available (QSFP-DD)
         """
-        raise NotImplementedError
+        status_flags_dict = self._take_status_flags(())
+        if status_flags_dict is None:
+            return None
+        return status_flags_dict['tx_disable_channel']
 
     def get_lpmode(self):
         """
@@ -1206,10 +1784,8 @@ class Sfp(SfpBase):
             A Boolean, True if lpmode is enabled, False if disabled
         """
         if self.lp_file is not None:
-            data = self.__read_attr_file(self.lp_file, 0)
-            if data is not None:
-                if int(data) == 1:
-                    return True
+            if self.__read_attr_int(self.lp_file) == 1:
+                return True
         return False
 
     def get_power_override(self):
@@ -1272,7 +1848,7 @@ class Sfp(SfpBase):
         if self.sfp_type == SFP_TYPE:
             sfpd_obj._calibration_type = 1
             
-        dom_temperature_raw = self._read_eeprom_bytes(field_offset + Id_field['TEMPERATURE'][OFFSET], Id_field['TEMPERATURE'][WIDTH], path_idx)
+        dom_temperature_raw = self._read_dom_bytes(field_offset + Id_field['TEMPERATURE'][OFFSET], Id_field['TEMPERATURE'][WIDTH], path_idx)
         if dom_temperature_raw is not None:
             dom_temperature_data = sfpd_obj.parse_temperature(dom_temperature_raw, 0)
             temp = self._convert_string_to_num(dom_temperature_data['data']['Temperature']['value'])
@@ -1289,6 +1865,7 @@ class Sfp(SfpBase):
         Returns:
             An integer number of supply voltage in mV
         """
+        self._refresh_dom_capability()
         if not self.dom_supported:
             return None
         path_idx = INDEX_A0H
@@ -1324,7 +1901,7 @@ class Sfp(SfpBase):
         if self.sfp_type == SFP_TYPE:
             sfpd_obj._calibration_type = self.calibration
         
-        dom_voltage_raw = self._read_eeprom_bytes(field_offset + Id_field['VOLTAGE'][OFFSET], Id_field['VOLTAGE'][WIDTH], path_idx)
+        dom_voltage_raw = self._read_dom_bytes(field_offset + Id_field['VOLTAGE'][OFFSET], Id_field['VOLTAGE'][WIDTH], path_idx)
         if dom_voltage_raw is not None:
             dom_voltage_data = sfpd_obj.parse_voltage(dom_voltage_raw, 0)
             volt = self._convert_string_to_num(dom_voltage_data['data']['Vcc']['value'])
@@ -1341,6 +1918,7 @@ class Sfp(SfpBase):
             for channel 0 to channel 4.
             Ex. ['110.09', '111.12', '108.21', '112.09']
         """
+        self._refresh_dom_capability()
         path_idx = INDEX_A0H
         tx_bias_list = []
         
@@ -1373,7 +1951,7 @@ class Sfp(SfpBase):
             return None
                
         if self.sfp_type == QSFP_TYPE:
-            dom_channel_monitor_raw = self._read_eeprom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+            dom_channel_monitor_raw = self._read_dom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
             if dom_channel_monitor_raw is not None:
                 dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params_with_tx_power(dom_channel_monitor_raw, 0)
                 tx_bias_list.append(self._convert_string_to_num(dom_channel_monitor_data['data']['TX1Bias']['value']))
@@ -1382,7 +1960,9 @@ class Sfp(SfpBase):
                 tx_bias_list.append(self._convert_string_to_num(dom_channel_monitor_data['data']['TX4Bias']['value']))
         
         elif self.sfp_type == QSFP_DD_TYPE:
-            dom_tx_bias_raw = self._read_eeprom_bytes(field_offset + Id_field['TX_BIAS'][OFFSET], Id_field['TX_BIAS'][WIDTH], path_idx)
+            dom_tx_bias_raw = self._read_dom_bytes(field_offset + Id_field['TX_BIAS'][OFFSET], Id_field['TX_BIAS'][WIDTH])
+            if dom_tx_bias_raw is None:
+                return tx_bias_list
             dom_tx_bias_data = sfpd_obj.parse_dom_tx_bias(dom_tx_bias_raw, 0)
             
             if self.dom_tx_bias_power_supported:
@@ -1395,7 +1975,7 @@ class Sfp(SfpBase):
                 tx_bias_list.append(self._convert_string_to_num(dom_tx_bias_data['data']['TX7Bias']['value']))
                 tx_bias_list.append(self._convert_string_to_num(dom_tx_bias_data['data']['TX8Bias']['value']))
         else:
-            dom_channel_monitor_raw = self._read_eeprom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+            dom_channel_monitor_raw = self._read_dom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
             if dom_channel_monitor_raw is not None:
                 dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params(dom_channel_monitor_raw, 0)
                 tx_bias_list.append(self._convert_string_to_num(dom_channel_monitor_data['data']['TXBias']['value']))
@@ -1412,6 +1992,7 @@ class Sfp(SfpBase):
             power in mW for channel 0 to channel 4.
             Ex. ['1.77', '1.71', '1.68', '1.70']
         """
+        self._refresh_dom_capability()
         path_idx = INDEX_A0H
         rx_power_list = []
         
@@ -1449,7 +2030,7 @@ class Sfp(SfpBase):
             sfpd_obj._calibration_type = self.calibration
        
         if self.sfp_type == QSFP_DD_TYPE:
-            dom_rx_power_raw = self._read_eeprom_bytes(field_offset + Id_field['RX_POWER'][OFFSET], Id_field['RX_POWER'][WIDTH])
+            dom_rx_power_raw = self._read_dom_bytes(field_offset + Id_field['RX_POWER'][OFFSET], Id_field['RX_POWER'][WIDTH])
             if dom_rx_power_raw is not None:
                 dom_rx_power_data = sfpd_obj.parse_dom_rx_power(dom_rx_power_raw, 0)
                 rx_power_list.append(self._convert_string_to_num(dom_rx_power_data['data']['RX1Power']['value']))
@@ -1462,7 +2043,7 @@ class Sfp(SfpBase):
                 rx_power_list.append(self._convert_string_to_num(dom_rx_power_data['data']['RX8Power']['value']))
         
         else:
-            dom_channel_monitor_raw = self._read_eeprom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+            dom_channel_monitor_raw = self._read_dom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
             if dom_channel_monitor_raw is not None:
                 if self.sfp_type == QSFP_TYPE:
                     dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params_with_tx_power(dom_channel_monitor_raw, 0)
@@ -1487,6 +2068,7 @@ class Sfp(SfpBase):
             for channel 0 to channel 4.
             Ex. ['1.86', '1.86', '1.86', '1.86']
         """
+        self._refresh_dom_capability()
         path_idx = INDEX_A0H
         tx_power_list = []
         
@@ -1523,7 +2105,7 @@ class Sfp(SfpBase):
             sfpd_obj._calibration_type = self.calibration
         
         if self.sfp_type == QSFP_DD_TYPE:
-            dom_tx_power_raw = self._read_eeprom_bytes(field_offset + Id_field['TX_POWER'][OFFSET], Id_field['TX_POWER'][WIDTH])
+            dom_tx_power_raw = self._read_dom_bytes(field_offset + Id_field['TX_POWER'][OFFSET], Id_field['TX_POWER'][WIDTH])
             if dom_tx_power_raw is not None:
                 dom_tx_power_data = sfpd_obj.parse_dom_tx_power(dom_tx_power_raw, 0)
                 tx_power_list.append(self._convert_string_to_num(dom_tx_power_data['data']['TX1Power']['value']))
@@ -1535,7 +2117,7 @@ class Sfp(SfpBase):
                 tx_power_list.append(self._convert_string_to_num(dom_tx_power_data['data']['TX7Power']['value']))
                 tx_power_list.append(self._convert_string_to_num(dom_tx_power_data['data']['TX8Power']['value']))
         else:
-            dom_channel_monitor_raw = self._read_eeprom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
+            dom_channel_monitor_raw = self._read_dom_bytes(field_offset + Id_field['CHANNEL_MON'][OFFSET], Id_field['CHANNEL_MON'][WIDTH], path_idx)
             if dom_channel_monitor_raw is not None:
                 if self.sfp_type == QSFP_TYPE:
                     dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params_with_tx_power(dom_channel_monitor_raw, 0)
@@ -1558,8 +2140,8 @@ class Sfp(SfpBase):
             A boolean, True if successful, False if not
         """
         if self.reset_file is not None:
-            ret = self.__write_attr_file(self.reset_file, '1')
-            if ret != 0:
+            if write_attr(self.reset_file, '1'):
+                self._invalidate_static_info()
                 return True
         return False
     
@@ -1604,10 +2186,10 @@ class Sfp(SfpBase):
         """
         if self.lp_file is not None:
             if lpmode is True:
-                ret = self.__write_attr_file(self.lp_file, "1")
+                ret = write_attr(self.lp_file, "1")
             else:
-                ret = self.__write_attr_file(self.lp_file, "0")
-            if ret != 0:
+                ret = write_attr(self.lp_file, "0")
+            if ret:
                 return True
         return False
     
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+#############################################################################
+#
+# Module contains the access to the sysfs attribute files shared by all
+# devices of the platform, polled attributes are kept open and read again
+# from offset 0, the values of slowly changing attributes are cached by a
+# policy on their path
+#
+#############################################################################
+
+try:
+    import os
+    import re
+    import time
+    import threading
+    import resource
+    from sonic_py_common.logger import Logger
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found")
+
+logger = Logger("sysfs_attr")
+
+# a sysfs attribute is at most one page
+SYSFS_ATTR_READ_SIZE = 4096
+# number of attribute files kept open, the ones opened beyond it are closed after each read,
+# at most a quarter of the open file limit of the process (pmon runs with 1024 and the eeprom
+# files kept open by Sfp take up to 256 more)
+SYSFS_ATTR_MAX_FDS = 256
+
+def _get_max_fds():
+    try:
+        limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    except (ValueError, OSError):
+        return SYSFS_ATTR_MAX_FDS
+    if limit == resource.RLIM_INFINITY or limit <= 0:
+        return SYSFS_ATTR_MAX_FDS
+    return min(SYSFS_ATTR_MAX_FDS, limit // 4)
+
+# os.pread is python 3 only, python 2 seeks back to 0 and reads under the lock
+_pread = getattr(os, 'pread', None)
+# path : _CachedFd
+_fd_dict = {}
+_fd_lock = threading.Lock()
+_max_fds = _get_max_fds()
+
+# TTL policies set by set_attr_ttl_policies(), a list of (name, compiled expression, ttl)
+_ttl_policy_list = []
+# path : the policy applying to it, None if the path isn't cached
+_ttl_path_dict = {}
+# path : (read time, expiry time, raw data)
+_ttl_cache_dict = {}
+# policy name : [hits, misses]
+_ttl_stats_dict = {}
+# path : number of writes, a read started before a write doesn't store its value after it
+_ttl_write_gen_dict = {}
+_ttl_lock = threading.Lock()
+
+class _CachedFd(object):
+    # an attribute file kept open, the readers using it hold a reference so it's only
+    # closed once it has been dropped from _fd_dict and the last reader has released it,
+    # no reader ever uses a closed fd or one the kernel has handed out again
+    __slots__ = ('path', 'fd', 'users', 'dropped')
+
+    def __init__(self, path, fd):
+        self.path = path
+        self.fd = fd
+        self.users = 0
+        self.dropped = False
+
+def _open_fd(filepath):
+    return os.open(filepath, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+
+def _read_fd(fd):
+    if _pread is not None:
+        return _pread(fd, SYSFS_ATTR_READ_SIZE, 0)
+    with _fd_lock:
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, SYSFS_ATTR_READ_SIZE)
+
+def _get_fd(filepath):
+    # the cached fd of the path with a reference taken, None if it isn't cached
+    with _fd_lock:
+        entry = _fd_dict.get(filepath)
+        if entry is not None:
+            entry.users += 1
+        return entry
+
+def _put_fd(entry, drop=False):
+    # releases the reference, drop removes the fd from the cache so the next read opens the path again
+    with _fd_lock:
+        entry.users -= 1
+        if drop and not entry.dropped:
+            entry.dropped = True
+            if _fd_dict.get(entry.path) is entry:
+                del _fd_dict[entry.path]
+        close = entry.dropped and entry.users == 0
+    if close:
+        os.close(entry.fd)
+
+def _read_raw(filepath):
+    # raises OSError/IOError when the file can't be read
+    entry = _get_fd(filepath)
+    if entry is not None:
+        failed = False
+        try:
+            return _read_fd(entry.fd)
+        except (IOError, OSError):
+            # the device behind the file has been removed (ENODEV) or
+            # reloaded, open the path again
+            failed = True
+        finally:
+            _put_fd(entry, failed)
+
+    fd = _open_fd(filepath)
+    entry = None
+    with _fd_lock:
+        if filepath not in _fd_dict and len(_fd_dict) < _max_fds:
+            entry = _CachedFd(filepath, fd)
+            entry.users = 1
+            _fd_dict[filepath] = entry
+    if entry is None:
+        try:
+            return _read_fd(fd)
+        finally:
+            os.close(fd)
+
+    failed = False
+    try:
+        return _read_fd(fd)
+    except (IOError, OSError):
+        failed = True
+        raise
+    finally:
+        _put_fd(entry, failed)
+
+def _get_ttl_policy(filepath):
+    try:
+        return _ttl_path_dict[filepath]
+    except KeyError:
+        pass
+    policy = None
+    for name, expr, ttl in _ttl_policy_list:
+        if expr.search(filepath) is not None:
+            policy = (name, ttl)
+            break
+    _ttl_path_dict[filepath] = policy
+    return policy
+
+def _read_cached(filepath):
+    policy = _get_ttl_policy(filepath)
+    if policy is None:
+        return _read_raw(filepath)
+
+    name, ttl = policy
+    now = time.time()
+    with _ttl_lock:
+        entry = _ttl_cache_dict.get(filepath)
+        stats = _ttl_stats_dict[name]
+        # an entry read in the future (clock went back) is expired
+        if entry is not None and entry[0] <= now < entry[1]:
+            stats[0] += 1
+            return entry[2]
+        stats[1] += 1
+        write_gen = _ttl_write_gen_dict.get(filepath, 0)
+    data = _read_raw(filepath)
+    with _ttl_lock:
+        if _ttl_write_gen_dict.get(filepath, 0) == write_gen:
+            _ttl_cache_dict[filepath] = (now, now + ttl, data)
+    return data
+
+def _to_str(data):
+    if isinstance(data, str):
+        return data
+    return data.decode('utf-8', 'replace')
+
+def read_attr(filepath, line=0xFF):
+    """
+    Retrieves the content of an attribute file
+
+    Args:
+        filepath: path of the file
+        line: index of the line to return, 0xFF for the whole content
+    Returns:
+        A string without the trailing newline, None if the file can't be read
+    """
+    try:
+        data = _to_str(_read_cached(filepath))
+        if line == 0xFF:
+            return data.rstrip('\r\n')
+        return data.splitlines()[line].rstrip('\r\n')
+    except Exception as ex:
+        logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
+
+    return None
+
+def read_attr_int(filepath, base=10):
+    """
+    Retrieves the integer value of an attribute file
+
+    Args:
+        filepath: path of the file
+        base: base of the number in the file, 16 accepts an optional 0x prefix
+    Returns:
+        An integer, None if the file can't be read or doesn't hold a number
+    """
+    try:
+        # int() skips the surrounding whitespace and newline itself
+        return int(_read_cached(filepath), base)
+    except Exception as ex:
+        logger.log_error("Unable to read an integer from {} due to {}".format(filepath, repr(ex)))
+
+    return None
+
+def read_attr_float(filepath):
+    """
+    Retrieves the float value of an attribute file
+
+    Args:
+        filepath: path of the file
+    Returns:
+        A float, None if the file can't be read or doesn't hold a number
+    """
+    try:
+        return float(_read_cached(filepath))
+    except Exception as ex:
+        logger.log_error("Unable to read a number from {} due to {}".format(filepath, repr(ex)))
+
+    return None
+
+def write_attr(filepath, data):
+    """
+    Writes an attribute file
+
+    Args:
+        filepath: path of the file
+        data: string to write
+    Returns:
+        A boolean, True if the write succeeded
+    """
+    try:
+        with open(filepath, 'w') as fd:
+            fd.write(data)
+        return True
+    except Exception as ex:
+        logger.log_error("Unable to write {} due to {}".format(filepath, repr(ex)))
+    finally:
+        # also after a failed write, part of the data may have been written
+        with _ttl_lock:
+            _ttl_write_gen_dict[filepath] = _ttl_write_gen_dict.get(filepath, 0) + 1
+            _ttl_cache_dict.pop(filepath, None)
+
+    return False
+
+def close_attrs():
+    """
+    Closes all attribute files kept open, e.g. after the drivers have been reloaded
+    """
+    # the files being read are closed by their reader when it's done
+    fd_list = []
+    with _fd_lock:
+        for entry in _fd_dict.values():
+            entry.dropped = True
+            if entry.users == 0:
+                fd_list.append(entry.fd)
+        _fd_dict.clear()
+    for fd in fd_list:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+def set_attr_ttl_policies(policy_list):
+    """
+    Sets the time the value of an attribute file is cached, by its path
+
+    Args:
+        policy_list: A list of (name, regular expression searched in the path, time in seconds),
+                     the first matching policy applies, the files matching none are read on
+                     every call
+    """
+    global _ttl_policy_list
+    with _ttl_lock:
+        _ttl_policy_list = [(name, re.compile(expr), ttl) for name, expr, ttl in policy_list]
+        _ttl_path_dict.clear()
+        _ttl_cache_dict.clear()
+        for name, expr, ttl in policy_list:
+            _ttl_stats_dict.setdefault(name, [0, 0])
+
+def clear_attr_cache():
+    """
+    Drops all cached attribute values, the next read of each file goes to sysfs
+    """
+    with _ttl_lock:
+        _ttl_cache_dict.clear()
+
+def get_attr_cache_stats():
+    """
+    Retrieves the hit/miss counters of the TTL policies
+
+    Returns:
+        A dict, policy name : {'ttl': time in seconds, 'hits': integer, 'misses': integer}
+    """
+    stats_dict = {}
+    with _ttl_lock:
+        for name, expr, ttl in _ttl_policy_list:
+            hits, misses = _ttl_stats_dict[name]
+            stats_dict[name] = {'ttl': ttl, 'hits': hits, 'misses': misses}
+    return stats_dict
@@ -8,15 +8,34 @@
 #############################################################################
 
 try:
+    import sys
     from sonic_py_common.logger import Logger
     from sonic_platform_base.thermal_base import ThermalBase
+    from sonic_platform.sysfs_attr import read_attr_float
+    from sonic_platform.hw_snapshot import SnapshotReader, ThermalReading
 except ImportError as e:
     raise ImportError (str(e) + "- required module not found")
     
     
 logger = Logger("thermal")
-class Thermal(ThermalBase):
+
+try:
+    _intern = sys.intern
+except AttributeError:
+    _intern = intern
+
+def intern_path(path):
+    # sensors behind the BMC share the same threshold files, keep one copy of each path
+    # str() as python2 only interns str and the install info paths are unicode there
+    return _intern(str(path))
+
+class Thermal(ThermalBase, SnapshotReader):
     """Platform-specific Thermal class"""
+
+    __slots__ = ('index', 'name', 'filepath', 'support_mask', 'is_bmc',
+                 'temperature_file', 'high_thershold_file', 'low_threshold_file',
+                 'high_critical_file', 'low_critical_file',
+                 '_reading', '_reading_time', '_snapshot_window')
     def __init__(self, index, name, sysfile_path, is_bmc, support_mask=0x1, ext_sysfile_list=None):
         # index is used to indicate the temp{} under sffile_path 
         # support_mask:  1:support  0:not support
@@ -31,7 +50,7 @@ class Thermal(ThermalBase):
         
         self.index = index
         self.name = name
-        self.filepath = sysfile_path
+        self.filepath = None if sysfile_path is None else intern_path(sysfile_path)
         self.support_mask = support_mask
         self.is_bmc = is_bmc
 
@@ -40,6 +59,7 @@ class Thermal(ThermalBase):
         self.low_threshold_file = None
         self.high_critical_file = None
         self.low_critical_file = None
+        self._init_snapshot_reader()
         
         if sysfile_path is None:
             return
@@ -47,50 +67,41 @@ class Thermal(ThermalBase):
         if self.is_bmc ==False or support_mask & 0x80 == 0x80:
             if support_mask & 0x1:
                 self.temperature_file = \
-                    sysfile_path + "/temp{}_input".format(self.index)
+                    intern_path(sysfile_path + "/temp{}_input".format(self.index))
             if support_mask & 0x2:
                 self.high_thershold_file = \
-                    sysfile_path + "/temp{}_max".format(self.index)
+                    intern_path(sysfile_path + "/temp{}_max".format(self.index))
             if support_mask & 0x4:
                 self.low_threshold_file = \
-                    sysfile_path + "/temp{}_min".format(self.index)
+                    intern_path(sysfile_path + "/temp{}_min".format(self.index))
             if support_mask & 0x8:
                 self.high_critical_file = \
-                    sysfile_path + "/temp{}_crit".format(self.index)
+                    intern_path(sysfile_path + "/temp{}_crit".format(self.index))
             if support_mask & 0x10:
                 self.low_critical_file = \
-                    sysfile_path + "/temp{}_lcrit".format(self.index)
+                    intern_path(sysfile_path + "/temp{}_lcrit".format(self.index))
         elif self.is_bmc and ext_sysfile_list is not None:
             if support_mask & 0x1:
                 self.temperature_file = \
-                    sysfile_path + ext_sysfile_list[self.index][0]
+                    intern_path(sysfile_path + ext_sysfile_list[self.index][0])
             if support_mask & 0x2:
                 self.high_thershold_file = \
-                    sysfile_path + ext_sysfile_list[self.index][1]
+                    intern_path(sysfile_path + ext_sysfile_list[self.index][1])
             if support_mask & 0x4:
                 self.low_threshold_file = \
-                    sysfile_path + ext_sysfile_list[self.index][2]
+                    intern_path(sysfile_path + ext_sysfile_list[self.index][2])
             if support_mask & 0x8:
                 self.high_critical_file = \
-                    sysfile_path + ext_sysfile_list[self.index][3]
+                    intern_path(sysfile_path + ext_sysfile_list[self.index][3])
             if support_mask & 0x10:
                 self.low_critical_file = \
-                    sysfile_path + ext_sysfile_list[self.index][4]
-    
-    def __read_attr_file(self, filepath, line=0xFF):
-        try:
-            with open(filepath,'r') as fd:
-                if line == 0xFF:
-                    data = fd.read()
-                    return data.rstrip('\r\n')
-                else:
-                    data = fd.readlines()
-                    return data[line].rstrip('\r\n')
-        except Exception as ex:
-            logger.log_error("Unable to open {} due to {}".format(filepath, repr(ex)))
-        
-        return None
+                    intern_path(sysfile_path + ext_sysfile_list[self.index][4])
     
+    def _read_reading(self):
+        return ThermalReading(self.name, self.get_temperature(), self.get_high_threshold(),
+                              self.get_low_threshold(), self.get_high_critical_threshold(),
+                              self.get_low_critical_threshold())
+
     def get_name(self):
         return self.name
     
@@ -105,10 +116,13 @@ class Thermal(ThermalBase):
             A float number of current temperature in Celsius up to nearest thousandth
             of one degree Celsius, e.g. 30.125 
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.temperature
         if self.temperature_file is not None:
-            temp = self.__read_attr_file( self.temperature_file )
+            temp = read_attr_float(self.temperature_file)
             if temp is not None:
-                return float(temp) / 1000
+                return temp / 1000
         
         return None
 
@@ -120,10 +134,13 @@ class Thermal(ThermalBase):
             A float number, the high threshold temperature of thermal in Celsius
             up to nearest thousandth of one degree Celsius, e.g. 30.125
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.high_threshold
         if self.high_thershold_file is not None:
-            temp = self.__read_attr_file( self.high_thershold_file )
+            temp = read_attr_float(self.high_thershold_file)
             if temp is not None:
-                return float(temp) / 1000
+                return temp / 1000
         
         return None
 
@@ -135,10 +152,13 @@ class Thermal(ThermalBase):
             A float number, the low threshold temperature of thermal in Celsius
             up to nearest thousandth of one degree Celsius, e.g. 30.125
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.low_threshold
         if self.low_threshold_file is not None:
-            temp = self.__read_attr_file( self.low_threshold_file )
+            temp = read_attr_float(self.low_threshold_file)
             if temp is not None:
-                return float(temp) / 1000
+                return temp / 1000
         
         return None
 
@@ -176,10 +196,13 @@ class Thermal(ThermalBase):
             A float number, the high critical threshold temperature of thermal in Celsius
             up to nearest thousandth of one degree Celsius, e.g. 30.125
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.high_critical_threshold
         if self.high_critical_file is not None:
-            temp = self.__read_attr_file( self.high_critical_file )
+            temp = read_attr_float(self.high_critical_file)
             if temp is not None:
-                return float(temp) / 1000
+                return temp / 1000
         
         return None
 
@@ -191,10 +214,13 @@ class Thermal(ThermalBase):
             A float number, the low critical threshold temperature of thermal in Celsius
             up to nearest thousandth of one degree Celsius, e.g. 30.125
         """
+        reading = self._get_fresh_reading()
+        if reading is not None:
+            return reading.low_critical_threshold
         if self.low_critical_file is not None:
-            temp = self.__read_attr_file( self.low_critical_file )
+            temp = read_attr_float(self.low_critical_file)
             if temp is not None:
-                return float(temp) / 1000
+                return temp / 1000
         
         return None
         
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+# Report the memory footprint and the construction time of the sonic_platform
+# objects of this platform. Run it on two builds of the package to compare them.
+#
+# usage: esc600_128q_platform_bench.py [-n count]
+#   -n count : number of Chassis to construct, default 1
+
+import os, sys, gc, getopt, time
+
+PROC_STATUS_FILE = '/proc/self/status'
+
+def get_rss_kb():
+    try:
+        with open(PROC_STATUS_FILE, 'r') as fd:
+            for line in fd:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except Exception as error:
+        print("Unable to open {} : {}".format(PROC_STATUS_FILE, error))
+    return 0
+
+def get_obj_size(obj):
+    # size of the object and of its attribute dict, the sonic_platform_base classes
+    # declare no __slots__ so every object still has one, holding the attributes
+    # its own class leaves out of __slots__
+    size = sys.getsizeof(obj)
+    attr_dict = getattr(obj, '__dict__', None)
+    if attr_dict is not None:
+        size += sys.getsizeof(attr_dict)
+    return size
+
+def report_objs(chassis):
+    obj_dict = {
+        'Sfp': chassis.get_all_sfps(),
+        'Thermal': chassis.get_all_thermals(),
+        'Fan': chassis.get_all_fans(),
+        'Psu': chassis.get_all_psus(),
+    }
+    for name in ('Sfp', 'Thermal', 'Fan', 'Psu'):
+        obj_list = obj_dict[name]
+        if len(obj_list) == 0:
+            print("{:<8} count 0".format(name))
+            continue
+        total = 0
+        for obj in obj_list:
+            total += get_obj_size(obj)
+        print("{:<8} count {:<4} bytes/obj {:<6} total {} bytes".format(name, len(obj_list),
+                                                                       total // len(obj_list), total))
+
+def main():
+    count = 1
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'hn:')
+    except getopt.GetoptError:
+        print("usage: {} [-n count]".format(os.path.basename(__file__)))
+        sys.exit(1)
+    for opt, arg in opts:
+        if opt == '-h':
+            print("usage: {} [-n count]".format(os.path.basename(__file__)))
+            sys.exit(0)
+        elif opt == '-n':
+            count = int(arg)
+
+    rss_start = get_rss_kb()
+    start_time = time.time()
+    from sonic_platform.platform import Platform
+    from sonic_platform.chassis import Chassis
+    import_time = time.time() - start_time
+    gc.collect()
+    rss_import = get_rss_kb()
+
+    # the first construction in the process, nothing is cached in memory yet
+    start_time = time.time()
+    platform = Platform()
+    platform_time = time.time() - start_time
+
+    chassis_list = [platform.get_chassis()]
+    start_time = time.time()
+    for n in range(1, count):
+        chassis_list.append(Chassis())
+    init_time = (time.time() - start_time) / max(count - 1, 1)
+    gc.collect()
+    rss_chassis = get_rss_kb()
+
+    print("RSS at start           : {} kB".format(rss_start))
+    print("RSS after import       : {} kB".format(rss_import))
+    print("RSS after {} Chassis    : {} kB".format(count, rss_chassis))
+    print("RSS per Chassis        : {} kB".format((rss_chassis - rss_import) // count))
+    print("import time            : {:.1f} ms".format(import_time * 1000))
+    print("Platform() cold time   : {:.1f} ms".format(platform_time * 1000))
+    if count > 1:
+        print("Chassis() warm time    : {:.1f} ms".format(init_time * 1000))
+    report_objs(chassis_list[0])
+
+if __name__ == '__main__':
+    main()